@@ -6,16 +6,32 @@ path generation, and project configuration management.
 """
 
 import sys
-from pathlib import Path
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
 from montu.shared.json_database import JSONDatabase
 from montu.shared.path_builder import PathBuilder
 
+# Task fields with reverse indices for fast get_tasks() filtering
+_INDEXED_TASK_FIELDS = ('status', 'priority', 'task', 'episode')
+
+# Short, heavily repeated task fields interned on load
+_INTERNED_TASK_FIELDS = ('status', 'priority', 'task', 'project', 'episode', 'sequence', 'shot')
+
+# Working file type for each task type
+_TASK_FILETYPE_MAP = {
+    'lighting': 'maya_scene',
+    'composite': 'nuke_script',
+    'comp': 'nuke_script',
+    'fx': 'houdini_scene',
+    'modeling': 'maya_scene',
+    'rigging': 'maya_scene',
+    'animation': 'maya_scene',
+    'layout': 'maya_scene',
+    'lookdev': 'maya_scene'
+}
+
 
 class ProjectModel:
     """
@@ -31,7 +47,11 @@ class ProjectModel:
         self.current_project_id: Optional[str] = None
         self.current_project_config: Optional[Dict[str, Any]] = None
         self.path_builder: Optional[PathBuilder] = None
-        self.tasks: List[Dict[str, Any]] = []
+        self._tasks: Optional[List[Dict[str, Any]]] = []  # None until first access
+        self._tasks_by_id: Dict[str, Dict[str, Any]] = {}
+        self._task_index: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {
+            field: {} for field in _INDEXED_TASK_FIELDS
+        }
         
         # Load available projects
         self.available_projects = self._load_available_projects()
@@ -55,6 +75,74 @@ class ProjectModel:
             print(f"Error loading projects: {e}")
             return []
     
+    @property
+    def tasks(self) -> List[Dict[str, Any]]:
+        """Tasks for the current project, fetched from the database on first access."""
+        self._ensure_tasks_loaded()
+        return self._tasks
+    
+    @tasks.setter
+    def tasks(self, tasks: List[Dict[str, Any]]):
+        self._tasks = tasks
+        self._rebuild_indices()
+    
+    def _ensure_tasks_loaded(self):
+        """Fetch current project tasks if load_project deferred them."""
+        if self._tasks is not None:
+            return
+        
+        try:
+            self.tasks = self.fetch_tasks(self.current_project_id)
+        except Exception as e:
+            print(f"Error loading tasks for project {self.current_project_id}: {e}")
+            self.tasks = []
+    
+    def fetch_tasks(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch a project's tasks from the database without changing model state.
+        
+        Safe to call from a worker thread; pass the result to set_loaded_tasks
+        on the GUI thread.
+        """
+        return self.db.find('tasks', {'project': project_id})
+    
+    def set_loaded_tasks(self, project_id: str, tasks: List[Dict[str, Any]]) -> bool:
+        """
+        Install tasks fetched by fetch_tasks and rebuild the task indices.
+        
+        Returns False, leaving the model unchanged, if another project was
+        loaded since the fetch started.
+        """
+        if project_id != self.current_project_id:
+            return False
+        
+        self.tasks = tasks
+        print(f"Loaded {len(tasks)} tasks for project {project_id}")
+        return True
+    
+    def _rebuild_indices(self):
+        """Intern repeated field values and rebuild task lookup indices after self.tasks is replaced."""
+        self._task_index = {field: {} for field in _INDEXED_TASK_FIELDS}
+        for task in self.tasks:
+            for field in _INTERNED_TASK_FIELDS:
+                value = task.get(field)
+                if isinstance(value, str):
+                    task[field] = sys.intern(value)
+            for field, buckets in self._task_index.items():
+                buckets.setdefault(task.get(field), []).append(task)
+        
+        self._tasks_by_id = {task.get('_id'): task for task in self.tasks}
+    
+    def _reindex_task(self, task: Dict[str, Any], field: str, new_value: Any):
+        """Move a task between index buckets when an indexed field changes."""
+        buckets = self._task_index[field]
+        old_bucket = buckets.get(task.get(field), [])
+        for i, indexed_task in enumerate(old_bucket):
+            if indexed_task is task:
+                del old_bucket[i]
+                break
+        buckets.setdefault(new_value, []).append(task)
+    
     def get_available_projects(self) -> List[Dict[str, str]]:
         """Get list of available projects."""
         return self.available_projects
@@ -85,10 +173,13 @@ class ProjectModel:
             # Set current project
             self.current_project_id = project_id
             
-            # Load project tasks
-            self.tasks = self.db.find('tasks', {'project': project_id})
+            # Defer task loading until tasks are first requested or set_loaded_tasks
+            # installs them; drop the previous project's indices now
+            self._tasks = None
+            self._tasks_by_id = {}
+            self._task_index = {field: {} for field in _INDEXED_TASK_FIELDS}
             
-            print(f"Loaded project {project_id} with {len(self.tasks)} tasks")
+            print(f"Loaded project {project_id}")
             return True
             
         except Exception as e:
@@ -96,7 +187,11 @@ class ProjectModel:
             return False
     
     def get_current_project(self) -> Optional[Dict[str, Any]]:
-        """Get current project information."""
+        """
+        Get current project information.
+        
+        Does not force a deferred task load; task_count is 0 until tasks are loaded.
+        """
         if not self.current_project_id or not self.current_project_config:
             return None
         
@@ -104,13 +199,17 @@ class ProjectModel:
             'id': self.current_project_id,
             'name': self.current_project_config.get('name', 'Unknown'),
             'description': self.current_project_config.get('description', ''),
-            'task_count': len(self.tasks)
+            'task_count': len(self._tasks) if self._tasks is not None else 0
         }
     
     def get_tasks(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get tasks for current project with optional filtering.
         
+        Returns a new list; the task dicts are shared with the indices, so
+        status and priority changes must go through update_task_status and
+        update_task_priority to keep the indices in sync.
+        
         Args:
             filters: Optional filters to apply (e.g., {'status': 'in_progress'})
             
@@ -120,29 +219,32 @@ class ProjectModel:
         if not self.current_project_id:
             return []
         
-        tasks = self.tasks.copy()
+        if not filters:
+            return list(self.tasks)
+        
+        self._ensure_tasks_loaded()
         
-        # Apply filters if provided
-        if filters:
-            filtered_tasks = []
-            for task in tasks:
-                match = True
-                for key, value in filters.items():
-                    if task.get(key) != value:
-                        match = False
-                        break
-                if match:
-                    filtered_tasks.append(task)
-            tasks = filtered_tasks
+        # Start from the smallest indexed bucket when any filter key is indexed
+        buckets = [
+            self._task_index[key].get(filters[key], [])
+            for key in _INDEXED_TASK_FIELDS if key in filters
+        ]
+        tasks = min(buckets, key=len) if buckets else self.tasks
         
-        return tasks
+        if buckets and len(filters) == 1:
+            return list(tasks)
+        
+        # Apply remaining filters
+        filter_items = tuple(filters.items())
+        return [
+            task for task in tasks
+            if all(task.get(key) == value for key, value in filter_items)
+        ]
     
     def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific task by ID."""
-        for task in self.tasks:
-            if task.get('_id') == task_id:
-                return task
-        return None
+        self._ensure_tasks_loaded()
+        return self._tasks_by_id.get(task_id)
     
     def update_task_status(self, task_id: str, status: str) -> bool:
         """
@@ -165,11 +267,11 @@ class ProjectModel:
             
             if success:
                 # Update local cache
-                for task in self.tasks:
-                    if task.get('_id') == task_id:
-                        task['status'] = status
-                        task['_updated_at'] = datetime.now().isoformat()
-                        break
+                task = self.get_task_by_id(task_id)
+                if task:
+                    self._reindex_task(task, 'status', status)
+                    task['status'] = status
+                    task['_updated_at'] = datetime.now().isoformat()
                 
                 print(f"Updated task {task_id} status to {status}")
                 return True
@@ -202,11 +304,11 @@ class ProjectModel:
 
             if success:
                 # Update local cache
-                for task in self.tasks:
-                    if task.get('_id') == task_id:
-                        task['priority'] = priority
-                        task['_updated_at'] = datetime.now().isoformat()
-                        break
+                task = self.get_task_by_id(task_id)
+                if task:
+                    self._reindex_task(task, 'priority', priority)
+                    task['priority'] = priority
+                    task['_updated_at'] = datetime.now().isoformat()
 
                 print(f"Updated task {task_id} priority to {priority}")
                 return True
@@ -258,20 +360,8 @@ class ProjectModel:
             return None
         
         # Determine file type based on task
-        file_type_map = {
-            'lighting': 'maya_scene',
-            'composite': 'nuke_script',
-            'comp': 'nuke_script',
-            'fx': 'houdini_scene',
-            'modeling': 'maya_scene',
-            'rigging': 'maya_scene',
-            'animation': 'maya_scene',
-            'layout': 'maya_scene',
-            'lookdev': 'maya_scene'
-        }
-        
         task_type = task.get('task', '').lower()
-        file_type = file_type_map.get(task_type, 'maya_scene')
+        file_type = _TASK_FILETYPE_MAP.get(task_type, 'maya_scene')
         
         paths = self.generate_task_paths(task_id, version, file_type)
         return paths['working_file_path'] if paths else None
@@ -284,16 +374,17 @@ class ProjectModel:
             # Add project-specific stats
             if self.current_project_id:
                 project_tasks = len(self.tasks)
-                status_counts = {}
                 
-                for task in self.tasks:
-                    status = task.get('status', 'unknown')
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                # Bucket sizes from the status index; tasks without a status count as unknown
+                status_counts = Counter()
+                for status, tasks in self._task_index['status'].items():
+                    if tasks:
+                        status_counts['unknown' if status is None else status] += len(tasks)
                 
                 stats['current_project'] = {
                     'id': self.current_project_id,
                     'task_count': project_tasks,
-                    'status_breakdown': status_counts
+                    'status_breakdown': dict(status_counts)
                 }
             
             return stats
@@ -62,6 +62,16 @@ class TaskListModel(QAbstractTableModel):
         self.filtered_tasks: List[Dict[str, Any]] = []
         self.current_filters: Dict[str, Any] = {}
         
+        # Per-column display strings for filtered_tasks, filled on first paint
+        self._col_display: List[List[Optional[str]]] = []
+        
+        # Role dispatch table; roles without a handler return None immediately
+        self._role_handlers = {
+            Qt.DisplayRole: self._display_data,
+            Qt.BackgroundRole: self._background_data,
+            Qt.ToolTipRole: self._tooltip_data,
+        }
+        
     def set_tasks(self, tasks: List[Dict[str, Any]]):
         """Set task data and refresh model."""
         self.beginResetModel()
@@ -105,6 +115,13 @@ class TaskListModel(QAbstractTableModel):
 
                 if match:
                     self.filtered_tasks.append(task)
+
+        self._reset_display_cache()
+
+    def _reset_display_cache(self):
+        """Drop cached display strings after filtered_tasks changes."""
+        row_count = len(self.filtered_tasks)
+        self._col_display = [[None] * row_count for _ in self.COLUMNS]
     
     def refresh_filters(self):
         """Refresh current filters."""
@@ -127,22 +144,22 @@ class TaskListModel(QAbstractTableModel):
     
     def update_task_status(self, task_id: str, status: str):
         """Update task status in model."""
-        # Update in main task list
-        for task in self.tasks:
-            if task.get('_id') == task_id:
-                task['status'] = status
-                break
-        
-        # Update in filtered list
-        for task in self.filtered_tasks:
-            if task.get('_id') == task_id:
-                task['status'] = status
-                break
+        # Replace the task dict rather than mutating it; the dicts are shared
+        # with ProjectModel's indices, which only its own updates keep in sync
+        updated = None
+        for task_list in (self.tasks, self.filtered_tasks):
+            for i, task in enumerate(task_list):
+                if task.get('_id') == task_id:
+                    if updated is None:
+                        updated = dict(task, status=status)
+                    task_list[i] = updated
+                    break
         
         # Find row and emit data changed
         for row, task in enumerate(self.filtered_tasks):
             if task.get('_id') == task_id:
                 status_col = next(i for i, (_, field) in enumerate(self.COLUMNS) if field == 'status')
+                self._col_display[status_col][row] = None
                 index = self.createIndex(row, status_col)
                 self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.BackgroundRole])
                 break
@@ -169,76 +186,96 @@ class TaskListModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
         """Return data for given index and role."""
-        if not index.isValid() or index.row() >= len(self.filtered_tasks):
+        handler = self._role_handlers.get(role)
+        if handler is None or not index.isValid() or index.row() >= len(self.filtered_tasks):
             return None
         
-        task = self.filtered_tasks[index.row()]
-        column_name, field_name = self.COLUMNS[index.column()]
+        return handler(index.row(), index.column())
+    
+    def _display_data(self, row: int, column: int) -> str:
+        """Return cached display text for a cell, formatting it on first use."""
+        column_cache = self._col_display[column]
+        value = column_cache[row]
+        if value is None:
+            value = column_cache[row] = self._format_display(
+                self.filtered_tasks[row], self.COLUMNS[column][1]
+            )
+        return value
+    
+    def _format_display(self, task: Dict[str, Any], field_name: str) -> str:
+        """Format a task field for display."""
+        value = task.get(field_name, '')
         
-        if role == Qt.DisplayRole:
-            value = task.get(field_name, '')
-            
-            # Special formatting for certain fields
-            if field_name == 'frame_range':
-                if isinstance(value, dict):
-                    start = value.get('start', 0)
-                    end = value.get('end', 0)
-                    return f"{start}-{end}"
-                return str(value)
-            
-            elif field_name == 'estimated_duration_hours':
-                try:
-                    hours = float(value)
-                    return f"{hours:.1f}"
-                except (ValueError, TypeError):
-                    return str(value)
-            
-            elif field_name in ['sequence_clean', 'shot_clean']:
-                # Use cleaned names if available, fallback to original
-                if not value:
-                    original_field = field_name.replace('_clean', '')
-                    original_value = task.get(original_field, '')
-                    # Simple cleaning for display
-                    if original_value and '_' in original_value:
-                        parts = original_value.split('_')
-                        return parts[-1] if parts else original_value
-                    return original_value
-                return value
-            
-            elif field_name == 'working_file_path':
-                # Show filename only for display
-                if value:
-                    return value.split('/')[-1].split('\\')[-1]
-                return 'Not generated'
-            
+        # Special formatting for certain fields
+        if field_name == 'frame_range':
+            if isinstance(value, dict):
+                start = value.get('start', 0)
+                end = value.get('end', 0)
+                return f"{start}-{end}"
             return str(value)
         
-        elif role == Qt.BackgroundRole:
-            # Color coding based on status and priority
+        elif field_name == 'estimated_duration_hours':
+            try:
+                hours = float(value)
+                return f"{hours:.1f}"
+            except (ValueError, TypeError):
+                return str(value)
+        
+        elif field_name in ['sequence_clean', 'shot_clean']:
+            # Use cleaned names if available, fallback to original
+            if not value:
+                original_field = field_name.replace('_clean', '')
+                original_value = task.get(original_field, '')
+                # Simple cleaning for display
+                if original_value and '_' in original_value:
+                    parts = original_value.split('_')
+                    return parts[-1] if parts else original_value
+                return original_value
+            return value
+        
+        elif field_name == 'working_file_path':
+            # Show filename only for display
+            if value:
+                return value.split('/')[-1].split('\\')[-1]
+            return 'Not generated'
+        
+        return str(value)
+    
+    def _background_data(self, row: int, column: int) -> Optional[QBrush]:
+        """Return status/priority color coding for a cell."""
+        field_name = self.COLUMNS[column][1]
+        task = self.filtered_tasks[row]
+        
+        if field_name == 'status':
             status = task.get('status', '')
-            priority = task.get('priority', '')
-            
-            if field_name == 'status' and status in self.STATUS_COLORS:
+            if status in self.STATUS_COLORS:
                 return QBrush(self.STATUS_COLORS[status])
-            
-            elif field_name == 'priority' and priority in self.PRIORITY_COLORS:
+        
+        elif field_name == 'priority':
+            priority = task.get('priority', '')
+            if priority in self.PRIORITY_COLORS:
                 return QBrush(self.PRIORITY_COLORS[priority])
         
-        elif role == Qt.ToolTipRole:
-            # Provide tooltips for certain fields
-            if field_name == 'working_file_path':
-                return task.get(field_name, 'Path not generated')
-            
-            elif field_name == 'status':
-                status = task.get('status', '')
-                return f"Status: {status.replace('_', ' ').title()}"
-            
-            elif field_name == 'priority':
-                priority = task.get('priority', '')
-                return f"Priority: {priority.title()}"
-            
-            elif field_name == '_id':
-                return f"Task ID: {task.get('_id', '')}"
+        return None
+    
+    def _tooltip_data(self, row: int, column: int) -> Optional[str]:
+        """Return tooltips for certain fields."""
+        field_name = self.COLUMNS[column][1]
+        task = self.filtered_tasks[row]
+        
+        if field_name == 'working_file_path':
+            return task.get(field_name, 'Path not generated')
+        
+        elif field_name == 'status':
+            status = task.get('status', '')
+            return f"Status: {status.replace('_', ' ').title()}"
+        
+        elif field_name == 'priority':
+            priority = task.get('priority', '')
+            return f"Priority: {priority.title()}"
+        
+        elif field_name == '_id':
+            return f"Task ID: {task.get('_id', '')}"
         
         return None
     
@@ -8,12 +8,12 @@ task management, and file operations with the validated Phase 1 infrastructure.
 import sys
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QStatusBar, QMenuBar, QMessageBox, QProgressBar, QLabel
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
+from PySide6.QtCore import Qt, QTimer, QThread, Signal, Slot, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QIcon
 
 # Add src to path for imports
@@ -26,6 +26,31 @@ from .version_notes_widget import VersionNotesWidget
 from ..core.models.project_model import ProjectModel
 
 
+class _LoadTasksTaskSignals(QObject):
+    """Signals emitted by _LoadTasksTask (QRunnable is not a QObject)."""
+    
+    loaded = Signal(str, object, str)  # project_id, tasks, error message ("" on success)
+
+
+class _LoadTasksTask(QRunnable):
+    """Fetch a project's tasks from the database on a pool thread."""
+    
+    def __init__(self, project_model: ProjectModel, project_id: str):
+        super().__init__()
+        self.project_model = project_model
+        self.project_id = project_id
+        self.signals = _LoadTasksTaskSignals()
+    
+    def run(self):
+        """Fetch the tasks, then emit loaded."""
+        try:
+            tasks = self.project_model.fetch_tasks(self.project_id)
+        except Exception as e:
+            self.signals.loaded.emit(self.project_id, [], str(e))
+            return
+        self.signals.loaded.emit(self.project_id, tasks, "")
+
+
 class ProjectLauncherMainWindow(QMainWindow):
     """
     Main window for the Project Launcher application.
@@ -44,6 +69,7 @@ class ProjectLauncherMainWindow(QMainWindow):
         
         # State
         self.current_project_id: Optional[str] = None
+        self._load_tasks_task: Optional[_LoadTasksTask] = None
         
         # Setup UI
         self.setup_ui()
@@ -219,7 +245,7 @@ class ProjectLauncherMainWindow(QMainWindow):
             self.project_selector.refresh_complete()
     
     def load_project(self, project_id: str):
-        """Load a specific project."""
+        """Load a specific project; its tasks load off the UI thread and arrive in on_tasks_loaded."""
         try:
             self.show_progress("Loading project...")
             
@@ -229,23 +255,50 @@ class ProjectLauncherMainWindow(QMainWindow):
             if success:
                 self.current_project_id = project_id
                 
-                # Update project selector
-                project_info = self.project_model.get_current_project()
-                if project_info:
-                    self.project_selector.set_current_project(project_info)
-                
-                # Load tasks
-                tasks = self.project_model.get_tasks()
-                self.task_list.set_tasks(tasks)
-                
-                # Update status
-                self.update_status_display()
-                
-                self.status_bar.showMessage(f"Loaded project {project_id} with {len(tasks)} tasks", 3000)
-                
-            else:
-                self.show_error("Failed to load project", f"Could not load project {project_id}")
+                # Fetch tasks on the thread pool
+                task = _LoadTasksTask(self.project_model, project_id)
+                task.signals.loaded.connect(self.on_tasks_loaded, Qt.QueuedConnection)
+                self._load_tasks_task = task
+                QThreadPool.globalInstance().start(task)
+                return
+            
+            self.show_error("Failed to load project", f"Could not load project {project_id}")
+            self.project_selector.set_no_project_state()
+            
+        except Exception as e:
+            self.show_error("Error loading project", str(e))
+            self.project_selector.set_no_project_state()
+        
+        self.hide_progress()
+        self.project_selector.set_loading_state(False)
+    
+    @Slot(str, object, str)
+    def on_tasks_loaded(self, project_id: str, tasks: List[Dict[str, Any]], error: str):
+        """Install fetched tasks and show the project if it is still the current one."""
+        if project_id != self.current_project_id:
+            return  # Another project was selected while loading
+        
+        try:
+            if error:
+                self.show_error("Error loading project", error)
                 self.project_selector.set_no_project_state()
+                return
+            
+            if not self.project_model.set_loaded_tasks(project_id, tasks):
+                return
+            
+            # Update project selector
+            project_info = self.project_model.get_current_project()
+            if project_info:
+                self.project_selector.set_current_project(project_info)
+            
+            # Show tasks
+            self.task_list.set_tasks(self.project_model.get_tasks())
+            
+            # Update status
+            self.update_status_display()
+            
+            self.status_bar.showMessage(f"Loaded project {project_id} with {len(tasks)} tasks", 3000)
             
         except Exception as e:
             self.show_error("Error loading project", str(e))
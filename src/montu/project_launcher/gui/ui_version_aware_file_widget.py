@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'version_aware_file_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGroupBox, QHBoxLayout, QLabel,
+    QPushButton, QSizePolicy, QSplitter, QVBoxLayout,
+    QWidget)
+
+from montu.shared.version_widget import VersionHistoryWidget
+
+class Ui_VersionAwareFileWidget(object):
+    def setupUi(self, VersionAwareFileWidget):
+        if not VersionAwareFileWidget.objectName():
+            VersionAwareFileWidget.setObjectName(u"VersionAwareFileWidget")
+        self.main_layout = QVBoxLayout(VersionAwareFileWidget)
+        self.main_layout.setSpacing(5)
+        self.main_layout.setObjectName(u"main_layout")
+        self.main_layout.setContentsMargins(5, 5, 5, 5)
+        self.header_layout = QHBoxLayout()
+        self.header_layout.setObjectName(u"header_layout")
+        self.task_label = QLabel(VersionAwareFileWidget)
+        self.task_label.setObjectName(u"task_label")
+        self.task_label.setStyleSheet(u"QLabel {\n"
+"    font-weight: bold;\n"
+"    font-size: 14px;\n"
+"    padding: 5px;\n"
+"    background-color: #e8f4fd;\n"
+"    border: 1px solid #bee5eb;\n"
+"    border-radius: 3px;\n"
+"}")
+
+        self.header_layout.addWidget(self.task_label)
+
+        self.new_version_btn = QPushButton(VersionAwareFileWidget)
+        self.new_version_btn.setObjectName(u"new_version_btn")
+        self.new_version_btn.setStyleSheet(u"QPushButton {\n"
+"    background-color: #28a745;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    padding: 6px 12px;\n"
+"    border-radius: 3px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #218838;\n"
+"}\n"
+"QPushButton:disabled {\n"
+"    background-color: #6c757d;\n"
+"}")
+
+        self.header_layout.addWidget(self.new_version_btn)
+
+        self.open_latest_btn = QPushButton(VersionAwareFileWidget)
+        self.open_latest_btn.setObjectName(u"open_latest_btn")
+        self.open_latest_btn.setStyleSheet(u"QPushButton {\n"
+"    background-color: #007bff;\n"
+"    color: white;\n"
+"    border: none;\n"
+"    padding: 6px 12px;\n"
+"    border-radius: 3px;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: #0056b3;\n"
+"}\n"
+"QPushButton:disabled {\n"
+"    background-color: #6c757d;\n"
+"}")
+
+        self.header_layout.addWidget(self.open_latest_btn)
+
+
+        self.main_layout.addLayout(self.header_layout)
+
+        self.splitter = QSplitter(VersionAwareFileWidget)
+        self.splitter.setObjectName(u"splitter")
+        self.splitter.setOrientation(Qt.Orientation.Horizontal)
+        self.file_ops_group = QGroupBox(self.splitter)
+        self.file_ops_group.setObjectName(u"file_ops_group")
+        self.file_ops_layout = QVBoxLayout(self.file_ops_group)
+        self.file_ops_layout.setObjectName(u"file_ops_layout")
+        self.current_version_label = QLabel(self.file_ops_group)
+        self.current_version_label.setObjectName(u"current_version_label")
+        self.current_version_label.setStyleSheet(u"QLabel {\n"
+"    font-size: 12px;\n"
+"    padding: 8px;\n"
+"    background-color: #f8f9fa;\n"
+"    border: 1px solid #dee2e6;\n"
+"    border-radius: 3px;\n"
+"}")
+
+        self.file_ops_layout.addWidget(self.current_version_label)
+
+        self.published_version_label = QLabel(self.file_ops_group)
+        self.published_version_label.setObjectName(u"published_version_label")
+        self.published_version_label.setStyleSheet(u"QLabel {\n"
+"    font-size: 12px;\n"
+"    padding: 8px;\n"
+"    background-color: #d4edda;\n"
+"    border: 1px solid #c3e6cb;\n"
+"    border-radius: 3px;\n"
+"}")
+
+        self.file_ops_layout.addWidget(self.published_version_label)
+
+        self.buttons_layout = QVBoxLayout()
+        self.buttons_layout.setObjectName(u"buttons_layout")
+        self.save_new_version_btn = QPushButton(self.file_ops_group)
+        self.save_new_version_btn.setObjectName(u"save_new_version_btn")
+
+        self.buttons_layout.addWidget(self.save_new_version_btn)
+
+        self.open_version_btn = QPushButton(self.file_ops_group)
+        self.open_version_btn.setObjectName(u"open_version_btn")
+
+        self.buttons_layout.addWidget(self.open_version_btn)
+
+        self.compare_versions_btn = QPushButton(self.file_ops_group)
+        self.compare_versions_btn.setObjectName(u"compare_versions_btn")
+
+        self.buttons_layout.addWidget(self.compare_versions_btn)
+
+
+        self.file_ops_layout.addLayout(self.buttons_layout)
+
+        self.splitter.addWidget(self.file_ops_group)
+        self.version_group = QGroupBox(self.splitter)
+        self.version_group.setObjectName(u"version_group")
+        self.version_layout = QVBoxLayout(self.version_group)
+        self.version_layout.setObjectName(u"version_layout")
+        self.version_history_widget = VersionHistoryWidget(self.version_group)
+        self.version_history_widget.setObjectName(u"version_history_widget")
+
+        self.version_layout.addWidget(self.version_history_widget)
+
+        self.splitter.addWidget(self.version_group)
+
+        self.main_layout.addWidget(self.splitter)
+
+
+        self.retranslateUi(VersionAwareFileWidget)
+
+        QMetaObject.connectSlotsByName(VersionAwareFileWidget)
+    # setupUi
+
+    def retranslateUi(self, VersionAwareFileWidget):
+        self.task_label.setText(QCoreApplication.translate("VersionAwareFileWidget", u"No task selected", None))
+        self.new_version_btn.setText(QCoreApplication.translate("VersionAwareFileWidget", u"New Version", None))
+        self.open_latest_btn.setText(QCoreApplication.translate("VersionAwareFileWidget", u"Open Latest", None))
+        self.file_ops_group.setTitle(QCoreApplication.translate("VersionAwareFileWidget", u"File Operations", None))
+        self.current_version_label.setText(QCoreApplication.translate("VersionAwareFileWidget", u"Current Version: None", None))
+        self.published_version_label.setText(QCoreApplication.translate("VersionAwareFileWidget", u"Published Version: None", None))
+        self.save_new_version_btn.setText(QCoreApplication.translate("VersionAwareFileWidget", u"Save as New Version", None))
+        self.open_version_btn.setText(QCoreApplication.translate("VersionAwareFileWidget", u"Open Specific Version...", None))
+        self.compare_versions_btn.setText(QCoreApplication.translate("VersionAwareFileWidget", u"Compare Versions...", None))
+        self.version_group.setTitle(QCoreApplication.translate("VersionAwareFileWidget", u"Version History", None))
+        pass
+    # retranslateUi
+
@@ -5,14 +5,15 @@ Example showing how to integrate the Version Management System
 into the Project Launcher application.
 """
 
+import logging
 from typing import Optional
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QSplitter, QGroupBox, QMessageBox
-)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QWidget, QMessageBox
+from PySide6.QtCore import Signal
 
-from ...shared import VersionManager, VersionHistoryWidget
+from ...shared import VersionManager
+from .ui_version_aware_file_widget import Ui_VersionAwareFileWidget
+
+logger = logging.getLogger(__name__)
 
 
 class VersionAwareFileWidget(QWidget):
@@ -40,148 +41,28 @@ class VersionAwareFileWidget(QWidget):
         self.setup_connections()
     
     def setup_ui(self):
-        """Set up the widget UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-        
-        # Header
-        header_layout = QHBoxLayout()
-        
-        self.task_label = QLabel("No task selected")
-        self.task_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 14px;
-                padding: 5px;
-                background-color: #e8f4fd;
-                border: 1px solid #bee5eb;
-                border-radius: 3px;
-            }
-        """)
-        header_layout.addWidget(self.task_label)
-        
-        # Quick action buttons
-        self.new_version_btn = QPushButton("New Version")
-        self.new_version_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
-        header_layout.addWidget(self.new_version_btn)
-        
-        self.open_latest_btn = QPushButton("Open Latest")
-        self.open_latest_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
-        header_layout.addWidget(self.open_latest_btn)
-        
-        layout.addLayout(header_layout)
-        
-        # Main content area with splitter
-        splitter = QSplitter(Qt.Horizontal)
-        
-        # File operations panel
-        self.setup_file_operations_panel(splitter)
-        
-        # Version history panel
-        self.version_history_widget = VersionHistoryWidget()
-        version_group = QGroupBox("Version History")
-        version_layout = QVBoxLayout(version_group)
-        version_layout.addWidget(self.version_history_widget)
-        splitter.addWidget(version_group)
+        """Set up the widget UI from the compiled Designer form."""
+        self.ui = Ui_VersionAwareFileWidget()
+        self.ui.setupUi(self)
         
         # Set splitter proportions (60% file ops, 40% version history)
-        splitter.setSizes([600, 400])
-        
-        layout.addWidget(splitter)
+        self.ui.splitter.setSizes([600, 400])
         
         # Initially disable buttons
         self.update_button_states()
     
-    def setup_file_operations_panel(self, parent):
-        """Set up the file operations panel."""
-        file_ops_group = QGroupBox("File Operations")
-        layout = QVBoxLayout(file_ops_group)
-        
-        # Current version info
-        self.current_version_label = QLabel("Current Version: None")
-        self.current_version_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                padding: 8px;
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 3px;
-            }
-        """)
-        layout.addWidget(self.current_version_label)
-        
-        # Published version info
-        self.published_version_label = QLabel("Published Version: None")
-        self.published_version_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                padding: 8px;
-                background-color: #d4edda;
-                border: 1px solid #c3e6cb;
-                border-radius: 3px;
-            }
-        """)
-        layout.addWidget(self.published_version_label)
-        
-        # File operation buttons
-        buttons_layout = QVBoxLayout()
-        
-        self.save_new_version_btn = QPushButton("Save as New Version")
-        self.save_new_version_btn.clicked.connect(self.save_new_version)
-        buttons_layout.addWidget(self.save_new_version_btn)
-        
-        self.open_version_btn = QPushButton("Open Specific Version...")
-        self.open_version_btn.clicked.connect(self.open_specific_version)
-        buttons_layout.addWidget(self.open_version_btn)
-        
-        self.compare_versions_btn = QPushButton("Compare Versions...")
-        self.compare_versions_btn.clicked.connect(self.compare_versions)
-        buttons_layout.addWidget(self.compare_versions_btn)
-        
-        layout.addLayout(buttons_layout)
-        
-        parent.addWidget(file_ops_group)
-    
     def setup_connections(self):
         """Set up signal connections."""
-        self.new_version_btn.clicked.connect(self.create_new_version)
-        self.open_latest_btn.clicked.connect(self.open_latest_version)
+        self.ui.save_new_version_btn.clicked.connect(self.save_new_version)
+        self.ui.open_version_btn.clicked.connect(self.open_specific_version)
+        self.ui.compare_versions_btn.clicked.connect(self.compare_versions)
+        self.ui.new_version_btn.clicked.connect(self.create_new_version)
+        self.ui.open_latest_btn.clicked.connect(self.open_latest_version)
         
         # Connect version history signals
-        self.version_history_widget.versionSelected.connect(self.on_version_selected)
-        self.version_history_widget.versionCreated.connect(self.on_version_created)
-        self.version_history_widget.versionPublished.connect(self.on_version_published)
+        self.ui.version_history_widget.versionSelected.connect(self.on_version_selected)
+        self.ui.version_history_widget.versionCreated.connect(self.on_version_created)
+        self.ui.version_history_widget.versionPublished.connect(self.on_version_published)
     
     def set_task(self, task_id: str, project_id: str = None):
         """Set the current task for version management."""
@@ -189,10 +70,10 @@ class VersionAwareFileWidget(QWidget):
         self.current_project_id = project_id
         
         # Update UI
-        self.task_label.setText(f"Task: {task_id}")
+        self.ui.task_label.setText(f"Task: {task_id}")
         
         # Set task in version history widget
-        self.version_history_widget.set_task(task_id, project_id)
+        self.ui.version_history_widget.set_task(task_id, project_id)
         
         # Update version info
         self.update_version_info()
@@ -203,37 +84,37 @@ class VersionAwareFileWidget(QWidget):
     def update_version_info(self):
         """Update current and published version information."""
         if not self.current_task_id:
-            self.current_version_label.setText("Current Version: None")
-            self.published_version_label.setText("Published Version: None")
+            self.ui.current_version_label.setText("Current Version: None")
+            self.ui.published_version_label.setText("Published Version: None")
             return
         
         # Get latest version
         latest_version = self.version_manager.get_latest_version(self.current_task_id)
         if latest_version:
-            self.current_version_label.setText(f"Current Version: {latest_version}")
+            self.ui.current_version_label.setText(f"Current Version: {latest_version}")
         else:
-            self.current_version_label.setText("Current Version: None")
+            self.ui.current_version_label.setText("Current Version: None")
         
         # Get published version
         published_version = self.version_manager.get_published_version(self.current_task_id)
         if published_version:
-            self.published_version_label.setText(f"Published Version: {published_version}")
+            self.ui.published_version_label.setText(f"Published Version: {published_version}")
         else:
-            self.published_version_label.setText("Published Version: None")
+            self.ui.published_version_label.setText("Published Version: None")
     
     def update_button_states(self):
         """Update button enabled/disabled states."""
         has_task = self.current_task_id is not None
         
-        self.new_version_btn.setEnabled(has_task)
-        self.open_latest_btn.setEnabled(has_task)
-        self.save_new_version_btn.setEnabled(has_task)
-        self.open_version_btn.setEnabled(has_task)
-        self.compare_versions_btn.setEnabled(has_task)
+        self.ui.new_version_btn.setEnabled(has_task)
+        self.ui.open_latest_btn.setEnabled(has_task)
+        self.ui.save_new_version_btn.setEnabled(has_task)
+        self.ui.open_version_btn.setEnabled(has_task)
+        self.ui.compare_versions_btn.setEnabled(has_task)
     
     def create_new_version(self):
         """Create a new version using the version history widget."""
-        self.version_history_widget.create_version()
+        self.ui.version_history_widget.create_version()
     
     def open_latest_version(self):
         """Open the latest version of the current task."""
@@ -299,12 +180,12 @@ class VersionAwareFileWidget(QWidget):
     
     def on_version_selected(self, version: str):
         """Handle version selection from history widget."""
-        print(f"Version selected: {version}")
+        logger.debug("Version selected: %s", version)
         # Could update preview, enable specific actions, etc.
     
     def on_version_created(self, version: str):
         """Handle new version creation."""
-        print(f"New version created: {version}")
+        logger.debug("New version created: %s", version)
         self.update_version_info()
         
         # Show success message
@@ -316,7 +197,7 @@ class VersionAwareFileWidget(QWidget):
     
     def on_version_published(self, version: str):
         """Handle version publication."""
-        print(f"Version published: {version}")
+        logger.debug("Version published: %s", version)
         self.update_version_info()
         
         # Show success message
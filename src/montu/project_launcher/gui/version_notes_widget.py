@@ -5,20 +5,134 @@ Widget for displaying version-related metadata and notes when files are selected
 in the File Browser. Shows artist notes, review notes, version status, and creation date.
 """
 
+import functools
+import logging
 import os
-import sys
-from pathlib import Path
+import stat
+from pathlib import PurePath
 from typing import Dict, Any, Optional
 from datetime import datetime
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, 
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit,
     QGroupBox, QFrame, QScrollArea
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QFont, QPalette
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+logger = logging.getLogger(__name__)
+
+# Task type names that mark a path component as a task ID
+_TASK_TYPE_TOKENS = ('lighting', 'comp', 'modeling', 'rigging', 'animation')
+
+# DCC scene extensions stripped from task ID candidates
+_STRIP_EXTS = frozenset({'.ma', '.nk', '.hip'})
+
+
+def _parse_version(file_name: str) -> Optional[str]:
+    """Return the first three-digit '_v###' version in a file name, if any."""
+    for tail in file_name.split('_v')[1:]:
+        digits = tail[:3]
+        if len(digits) == 3 and digits.isdigit():
+            return digits
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _canned_version_data(task_type: str, task_status: str, version: str) -> tuple:
+    """Build example version notes from task type, status, and version."""
+    # Example version notes based on task status and type
+    if task_status == 'completed':
+        if task_type == 'lighting':
+            artist_note = "Final lighting pass completed"
+            review_note = "Approved by lighting supervisor"
+        elif task_type == 'comp':
+            artist_note = "Final composite with all elements"
+            review_note = "Client approved for delivery"
+        else:
+            artist_note = "Work completed as requested"
+            review_note = "Approved by supervisor"
+    elif task_status == 'in_progress':
+        artist_note = "Work in progress - latest version"
+        review_note = "Pending review"
+    else:
+        artist_note = "Initial version"
+        review_note = "Not yet reviewed"
+    
+    # Add version-specific comments
+    if version == "001":
+        comments = "Initial version for review"
+    elif version == "002":
+        comments = "Addressing feedback from v001"
+    elif version == "003":
+        comments = "Final version incorporating all notes"
+    else:
+        comments = f"Version {version} - continued iteration"
+    
+    return (
+        ('artist_note', artist_note),
+        ('review_note', review_note),
+        ('comments', comments),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_bold_font(point_size: int) -> QFont:
+    """Shared bold font; built on first use since QFont needs a QApplication."""
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(point_size)
+    return font
+
+
+def _set_if_changed(widget: QWidget, text: str):
+    """Set label or note text only when it differs, avoiding a relayout."""
+    if isinstance(widget, QPlainTextEdit):
+        if widget.toPlainText() != text:
+            widget.setPlainText(text)
+    elif widget.text() != text:
+        widget.setText(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_ctime(timestamp: int) -> str:
+    """Format a whole-second timestamp; batch renders share many of these."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _creation_date(file_stat: Optional[os.stat_result]) -> str:
+    """Format a file's creation date from its stat result."""
+    if file_stat is None:
+        return "Unknown"
+    return _format_ctime(int(file_stat.st_ctime))
+
+
+class _MetadataLoaderSignals(QObject):
+    """Signals emitted by _MetadataLoader (QRunnable is not a QObject)."""
+    
+    loaded = Signal(str, object, str, object)  # file_path, stat or None, creation_date, task or None
+
+
+class _MetadataLoader(QRunnable):
+    """Stat a file and format its creation date on a pool thread."""
+    
+    def __init__(self, file_path: str, task: Optional[Dict[str, Any]]):
+        super().__init__()
+        self.file_path = file_path
+        self.task = task
+        self.signals = _MetadataLoaderSignals()
+    
+    def run(self):
+        """Stat the file, then emit loaded; the stat is None unless it is a regular file."""
+        try:
+            file_stat = os.stat(self.file_path)
+        except OSError:
+            file_stat = None
+        
+        if file_stat is not None and not stat.S_ISREG(file_stat.st_mode):
+            file_stat = None
+        
+        creation_date = _creation_date(file_stat)
+        self.signals.loaded.emit(self.file_path, file_stat, creation_date, self.task)
 
 
 class VersionNotesWidget(QWidget):
@@ -41,6 +155,15 @@ class VersionNotesWidget(QWidget):
         self.current_task_id: Optional[str] = None
         self.current_version: Optional[str] = None
         self.project_model = None  # Will be set by parent
+        self._current_stat: Optional[os.stat_result] = None
+        
+        # Selection debouncing so fast keyboard navigation loads only the last file
+        self._pending_file_path: Optional[str] = None
+        self.selection_timer = QTimer()
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.setInterval(100)
+        self.selection_timer.timeout.connect(self._apply_pending_selection)
+        self._metadata_loader: Optional[_MetadataLoader] = None
         
         # Setup UI
         self.setup_ui()
@@ -61,10 +184,7 @@ class VersionNotesWidget(QWidget):
         
         # File name label
         self.file_name_label = QLabel("No file selected")
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(10)
-        self.file_name_label.setFont(font)
+        self.file_name_label.setFont(_get_bold_font(10))
         self.file_name_label.setWordWrap(True)
         file_info_layout.addWidget(self.file_name_label)
         
@@ -72,20 +192,21 @@ class VersionNotesWidget(QWidget):
         version_layout = QHBoxLayout()
         
         self.version_label = QLabel("Version: --")
-        self.version_label.setStyleSheet("color: #666;")
+        self.version_label.setProperty("muted", True)
         version_layout.addWidget(self.version_label)
         
         version_layout.addStretch()
         
         self.status_label = QLabel("Status: --")
-        self.status_label.setStyleSheet("color: #666;")
+        self.status_label.setProperty("muted", True)
         version_layout.addWidget(self.status_label)
         
         file_info_layout.addLayout(version_layout)
         
         # Creation date
         self.creation_date_label = QLabel("Created: --")
-        self.creation_date_label.setStyleSheet("color: #666; font-size: 9pt;")
+        self.creation_date_label.setObjectName("creationDateLabel")
+        self.creation_date_label.setProperty("muted", True)
         file_info_layout.addWidget(self.creation_date_label)
         
         main_layout.addWidget(file_info_frame)
@@ -97,62 +218,38 @@ class VersionNotesWidget(QWidget):
         
         # Artist notes
         artist_notes_label = QLabel("Artist Notes:")
-        artist_notes_label.setStyleSheet("font-weight: bold; color: #333;")
+        artist_notes_label.setProperty("noteHeader", True)
         notes_layout.addWidget(artist_notes_label)
         
-        self.artist_notes_text = QTextEdit()
+        self.artist_notes_text = QPlainTextEdit()
         self.artist_notes_text.setReadOnly(True)
         self.artist_notes_text.setMaximumHeight(60)
         self.artist_notes_text.setPlaceholderText("No artist notes available")
-        self.artist_notes_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 9pt;
-            }
-        """)
+        self.artist_notes_text.setObjectName("noteBox")
         notes_layout.addWidget(self.artist_notes_text)
         
         # Review notes
         review_notes_label = QLabel("Review Notes:")
-        review_notes_label.setStyleSheet("font-weight: bold; color: #333;")
+        review_notes_label.setProperty("noteHeader", True)
         notes_layout.addWidget(review_notes_label)
         
-        self.review_notes_text = QTextEdit()
+        self.review_notes_text = QPlainTextEdit()
         self.review_notes_text.setReadOnly(True)
         self.review_notes_text.setMaximumHeight(60)
         self.review_notes_text.setPlaceholderText("No review notes available")
-        self.review_notes_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 9pt;
-            }
-        """)
+        self.review_notes_text.setObjectName("noteBox")
         notes_layout.addWidget(self.review_notes_text)
         
         # Additional comments
         comments_label = QLabel("Additional Comments:")
-        comments_label.setStyleSheet("font-weight: bold; color: #333;")
+        comments_label.setProperty("noteHeader", True)
         notes_layout.addWidget(comments_label)
         
-        self.comments_text = QTextEdit()
+        self.comments_text = QPlainTextEdit()
         self.comments_text.setReadOnly(True)
         self.comments_text.setMaximumHeight(60)
         self.comments_text.setPlaceholderText("No additional comments")
-        self.comments_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 9pt;
-            }
-        """)
+        self.comments_text.setObjectName("noteBox")
         notes_layout.addWidget(self.comments_text)
         
         main_layout.addWidget(notes_frame)
@@ -162,6 +259,27 @@ class VersionNotesWidget(QWidget):
         
         layout.addWidget(main_group)
         
+        # Single stylesheet for all labels and note boxes
+        self.setStyleSheet("""
+            QLabel[muted="true"] {
+                color: #666;
+            }
+            QLabel#creationDateLabel {
+                font-size: 9pt;
+            }
+            QLabel[noteHeader="true"] {
+                font-weight: bold;
+                color: #333;
+            }
+            QPlainTextEdit#noteBox {
+                background-color: #f8f9fa;
+                border: 1px solid #dee2e6;
+                border-radius: 4px;
+                padding: 4px;
+                font-size: 9pt;
+            }
+        """)
+        
         # Set initial empty state
         self.set_empty_state()
     
@@ -170,16 +288,23 @@ class VersionNotesWidget(QWidget):
         self.project_model = project_model
     
     def set_selected_file(self, file_path: str):
-        """Set the currently selected file and load version notes."""
+        """Set the currently selected file; version notes load after a short delay."""
+        self._pending_file_path = file_path
+        self.selection_timer.start()
+    
+    def _apply_pending_selection(self):
+        """Load version notes for the last file passed to set_selected_file."""
+        file_path = self._pending_file_path
         if file_path == self.current_file_path:
             return  # No change
         
-        self.current_file_path = file_path
-        
-        if not file_path or not os.path.isfile(file_path):
+        if not file_path:
             self.set_empty_state()
             return
         
+        self.current_file_path = file_path
+        self._current_stat = None
+        
         # Extract version information from file path
         self.extract_version_info(file_path)
         
@@ -192,23 +317,19 @@ class VersionNotesWidget(QWidget):
             file_name = os.path.basename(file_path)
             
             # Try to extract version from filename (e.g., v001, v002)
-            import re
-            version_match = re.search(r'_v(\d{3})', file_name)
-            if version_match:
-                self.current_version = version_match.group(1)
-            else:
-                self.current_version = "001"  # Default version
+            self.current_version = _parse_version(file_name) or "001"  # Default version
             
             # Try to extract task ID from path structure
             # Expected path: .../project/episode/sequence/shot/task/version/filename
-            path_parts = file_path.replace('\\', '/').split('/')
-            
             # Look for task ID pattern in path
-            for part in reversed(path_parts):
-                if '_' in part and any(task_type in part.lower() for task_type in
-                                     ['lighting', 'comp', 'modeling', 'rigging', 'animation']):
+            for part in reversed(PurePath(file_path).parts):
+                if '_' not in part:
+                    continue
+                part_lower = part.lower()
+                if any(task_type in part_lower for task_type in _TASK_TYPE_TOKENS):
                     # This might be a task ID
-                    self.current_task_id = part.replace('.ma', '').replace('.nk', '').replace('.hip', '')
+                    stem, ext = os.path.splitext(part)
+                    self.current_task_id = stem if ext in _STRIP_EXTS else part
                     break
             
             if not self.current_task_id:
@@ -227,30 +348,45 @@ class VersionNotesWidget(QWidget):
             self.current_version = "001"
     
     def load_version_metadata(self):
-        """Load version metadata from database."""
-        if not self.project_model or not self.current_task_id:
-            self.set_file_info_only()
+        """Load version metadata off the UI thread; results arrive in on_metadata_loaded."""
+        # Look up the task here; ProjectModel's lazy task indices are not thread-safe
+        task = None
+        if self.project_model and self.current_task_id:
+            try:
+                task = self.project_model.get_task_by_id(self.current_task_id)
+            except Exception as e:
+                logger.error("Error loading version metadata: %s", e)
+        
+        loader = _MetadataLoader(self.current_file_path, task)
+        loader.signals.loaded.connect(self.on_metadata_loaded)
+        self._metadata_loader = loader
+        QThreadPool.globalInstance().start(loader)
+    
+    def on_metadata_loaded(self, file_path: str, file_stat: Optional[os.stat_result],
+                           creation_date: str, task: Optional[Dict[str, Any]]):
+        """Apply loaded metadata if the file is still the current selection."""
+        if file_path != self.current_file_path:
+            return  # Selection changed while loading
+        
+        if file_stat is None:
+            self.set_empty_state()  # Missing or not a regular file
+            return
+        
+        # Keep the stat result so get_creation_date never repeats the syscall
+        self._current_stat = file_stat
+        
+        if not task:
+            self.set_file_info_only(creation_date)
             return
         
         try:
-            # Get task information
-            task = self.project_model.get_task_by_id(self.current_task_id)
-            if not task:
-                self.set_file_info_only()
-                return
-            
             # Update file info
             file_name = os.path.basename(self.current_file_path)
-            self.file_name_label.setText(file_name)
-            self.version_label.setText(f"Version: v{self.current_version}")
+            _set_if_changed(self.file_name_label, file_name)
+            _set_if_changed(self.version_label, f"Version: v{self.current_version}")
             
-            # Get file creation date
-            try:
-                stat = os.stat(self.current_file_path)
-                creation_date = datetime.fromtimestamp(stat.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
-                self.creation_date_label.setText(f"Created: {creation_date}")
-            except:
-                self.creation_date_label.setText("Created: Unknown")
+            # Set file creation date
+            _set_if_changed(self.creation_date_label, f"Created: {creation_date}")
             
             # Load version notes from task data (if available)
             # Note: In a full implementation, this would query a versions table
@@ -259,113 +395,79 @@ class VersionNotesWidget(QWidget):
             # Set status based on task status
             task_status = task.get('status', 'unknown')
             status_display = task_status.replace('_', ' ').title()
-            self.status_label.setText(f"Status: {status_display}")
+            _set_if_changed(self.status_label, f"Status: {status_display}")
             
             # Load notes (example data structure)
             version_data = self.get_version_data(task, self.current_version)
             
             # Artist notes
-            artist_note = version_data.get('artist_note', '')
-            if artist_note:
-                self.artist_notes_text.setPlainText(artist_note)
-            else:
-                self.artist_notes_text.setPlainText("")
+            _set_if_changed(self.artist_notes_text, version_data.get('artist_note', ''))
             
             # Review notes
-            review_note = version_data.get('review_note', '')
-            if review_note:
-                self.review_notes_text.setPlainText(review_note)
-            else:
-                self.review_notes_text.setPlainText("")
+            _set_if_changed(self.review_notes_text, version_data.get('review_note', ''))
             
             # Additional comments
-            comments = version_data.get('comments', '')
-            if comments:
-                self.comments_text.setPlainText(comments)
-            else:
-                self.comments_text.setPlainText("")
+            _set_if_changed(self.comments_text, version_data.get('comments', ''))
             
         except Exception as e:
-            print(f"Error loading version metadata: {e}")
-            self.set_file_info_only()
+            logger.error("Error loading version metadata: %s", e)
+            self.set_file_info_only(creation_date)
     
     def get_version_data(self, task: Dict[str, Any], version: str) -> Dict[str, Any]:
         """Get version-specific data from task or database."""
         # In a full implementation, this would query a versions collection
         # For now, we'll simulate version data based on task information
-        
-        version_data = {}
-        
-        # Example version notes based on task status and type
         task_type = task.get('task', '').lower()
         task_status = task.get('status', '')
         
-        if task_status == 'completed':
-            if task_type == 'lighting':
-                version_data['artist_note'] = "Final lighting pass completed"
-                version_data['review_note'] = "Approved by lighting supervisor"
-            elif task_type == 'comp':
-                version_data['artist_note'] = "Final composite with all elements"
-                version_data['review_note'] = "Client approved for delivery"
-            else:
-                version_data['artist_note'] = "Work completed as requested"
-                version_data['review_note'] = "Approved by supervisor"
-        elif task_status == 'in_progress':
-            version_data['artist_note'] = "Work in progress - latest version"
-            version_data['review_note'] = "Pending review"
-        else:
-            version_data['artist_note'] = "Initial version"
-            version_data['review_note'] = "Not yet reviewed"
-        
-        # Add version-specific comments
-        if version == "001":
-            version_data['comments'] = "Initial version for review"
-        elif version == "002":
-            version_data['comments'] = "Addressing feedback from v001"
-        elif version == "003":
-            version_data['comments'] = "Final version incorporating all notes"
-        else:
-            version_data['comments'] = f"Version {version} - continued iteration"
-        
-        return version_data
+        return dict(_canned_version_data(task_type, task_status, version))
     
-    def set_file_info_only(self):
+    def get_creation_date(self) -> str:
+        """Get the formatted creation date of the current file."""
+        file_stat = self._current_stat
+        if file_stat is None:
+            try:
+                file_stat = os.stat(self.current_file_path)
+            except OSError:
+                pass
+        return _creation_date(file_stat)
+    
+    def set_file_info_only(self, creation_date: Optional[str] = None):
         """Set file info without version metadata."""
         if self.current_file_path:
             file_name = os.path.basename(self.current_file_path)
-            self.file_name_label.setText(file_name)
-            self.version_label.setText(f"Version: v{self.current_version or '001'}")
+            _set_if_changed(self.file_name_label, file_name)
+            _set_if_changed(self.version_label, f"Version: v{self.current_version or '001'}")
             
             # Get file creation date
-            try:
-                stat = os.stat(self.current_file_path)
-                creation_date = datetime.fromtimestamp(stat.st_ctime).strftime("%Y-%m-%d %H:%M:%S")
-                self.creation_date_label.setText(f"Created: {creation_date}")
-            except:
-                self.creation_date_label.setText("Created: Unknown")
+            if creation_date is None:
+                creation_date = self.get_creation_date()
+            _set_if_changed(self.creation_date_label, f"Created: {creation_date}")
             
-            self.status_label.setText("Status: Unknown")
+            _set_if_changed(self.status_label, "Status: Unknown")
         
         # Clear notes
-        self.artist_notes_text.setPlainText("")
-        self.review_notes_text.setPlainText("")
-        self.comments_text.setPlainText("")
+        _set_if_changed(self.artist_notes_text, "")
+        _set_if_changed(self.review_notes_text, "")
+        _set_if_changed(self.comments_text, "")
     
     def set_empty_state(self):
         """Set widget to empty state when no file is selected."""
         self.current_file_path = None
+        self._current_stat = None
         self.current_task_id = None
         self.current_version = None
         
-        self.file_name_label.setText("No file selected")
-        self.version_label.setText("Version: --")
-        self.status_label.setText("Status: --")
-        self.creation_date_label.setText("Created: --")
+        _set_if_changed(self.file_name_label, "No file selected")
+        _set_if_changed(self.version_label, "Version: --")
+        _set_if_changed(self.status_label, "Status: --")
+        _set_if_changed(self.creation_date_label, "Created: --")
         
-        self.artist_notes_text.setPlainText("")
-        self.review_notes_text.setPlainText("")
-        self.comments_text.setPlainText("")
+        _set_if_changed(self.artist_notes_text, "")
+        _set_if_changed(self.review_notes_text, "")
+        _set_if_changed(self.comments_text, "")
     
     def clear_selection(self):
         """Clear current file selection."""
+        self.selection_timer.stop()
         self.set_empty_state()
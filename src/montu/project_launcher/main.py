@@ -7,14 +7,10 @@ and integration with the validated Phase 1 infrastructure.
 
 import sys
 import os
-from pathlib import Path
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from .gui.main_window import ProjectLauncherMainWindow
 
 
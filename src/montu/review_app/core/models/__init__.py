@@ -5,5 +5,7 @@ Data models and business logic for the Review Application.
 """
 
 from .review_model import ReviewModel
+from .approval_history_model import ApprovalHistoryModel
+from .grouped_media_model import GroupedMediaModel, MediaRow
 
-__all__ = ['ReviewModel']
+__all__ = ['ReviewModel', 'ApprovalHistoryModel', 'GroupedMediaModel', 'MediaRow']
@@ -0,0 +1,127 @@
+"""
+Approval History Model
+
+Qt list model for displaying approval history entries in the Review Application.
+Keeps pre-formatted row text so views only pay for the rows they paint.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+from PySide6.QtCore import QAbstractListModel, Qt, QModelIndex
+from PySide6.QtGui import QColor
+
+
+class ApprovalHistoryModel(QAbstractListModel):
+    """
+    Qt model for approval history display.
+
+    Rows are shown most recent first, with status-based background colors.
+    """
+
+    # Background roles returned by format_entry
+    BG_DEFAULT = 0
+    BG_APPROVED = 1
+    BG_REJECTED = 2
+    BG_REVISION = 3
+
+    # History row backgrounds, indexed by background role
+    _BACKGROUNDS = (
+        None,
+        QColor(235, 255, 235),  # Light green
+        QColor(255, 235, 235),  # Light red
+        QColor(255, 245, 235)   # Light orange
+    )
+
+    # Background role by approval status value
+    _STATUS_BG_ROLE = {
+        'approved': BG_APPROVED,
+        'approved_with_notes': BG_APPROVED,
+        'final_approved': BG_APPROVED,
+        'rejected': BG_REJECTED,
+        'needs_revision': BG_REVISION
+    }
+
+    def __init__(self, parent=None):
+        """Initialize approval history model."""
+        super().__init__(parent)
+
+        # Parallel per-row arrays, most recent first
+        self._texts: List[str] = []
+        self._backgrounds: List[Optional[QColor]] = []
+
+    def set_history(self, history: List[Dict[str, Any]]):
+        """Replace all rows with the given history, oldest entry first."""
+        self.beginResetModel()
+        self._texts = []
+        self._backgrounds = []
+        for entry in reversed(history):  # Show most recent first
+            item_text, bg_role = self.format_entry(entry)
+            self._texts.append(item_text)
+            self._backgrounds.append(self._BACKGROUNDS[bg_role])
+        self.endResetModel()
+
+    def add_entry(self, entry: Dict[str, Any]):
+        """Add a new history entry at the top of the list."""
+        item_text, bg_role = self.format_entry(entry)
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._texts.insert(0, item_text)
+        self._backgrounds.insert(0, self._BACKGROUNDS[bg_role])
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return number of rows."""
+        if parent.isValid():
+            return 0
+        return len(self._texts)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return data for the given index and role."""
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._texts[row]
+        if role == Qt.BackgroundRole:
+            return self._backgrounds[row]
+        return None
+
+    @classmethod
+    def format_entry(cls, entry: Dict[str, Any]) -> Tuple[str, int]:
+        """
+        Format a history entry as (row text, background role).
+
+        The entry is not modified; the model keeps the formatted rows.
+        """
+        timestamp = entry.get('timestamp', '')
+        status_value = entry.get('status', '')
+        status = status_value.replace('_', ' ').title()
+        user = entry.get('user', 'Unknown')
+        notes = entry.get('notes', '')
+
+        # Format ISO timestamp
+        try:
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            time_str = dt.strftime('%m/%d %H:%M')
+        except (ValueError, TypeError, AttributeError):
+            time_str = 'Unknown'
+
+        # Create history item text
+        item_text = f"{time_str} - {status} by {user}"
+        if notes:
+            item_text += f": {notes[:50]}{'...' if len(notes) > 50 else ''}"
+
+        # Color code by status, matching unknown statuses by keyword
+        bg_role = cls._STATUS_BG_ROLE.get(status_value)
+        if bg_role is None:
+            status_lower = status_value.lower()
+            if 'approved' in status_lower:
+                bg_role = cls.BG_APPROVED
+            elif 'rejected' in status_lower:
+                bg_role = cls.BG_REJECTED
+            elif 'revision' in status_lower:
+                bg_role = cls.BG_REVISION
+            else:
+                bg_role = cls.BG_DEFAULT
+
+        return item_text, bg_role
@@ -0,0 +1,177 @@
+"""
+Grouped Media Model
+
+Qt tree model for displaying media files grouped by sequence in the Review Application.
+Rows are materialized by the view on demand, so only visible rows pay for formatting.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from PySide6.QtCore import QAbstractItemModel, Qt, QModelIndex
+from PySide6.QtGui import QColor, QFont
+
+
+# Status display text with emoji
+_STATUS_MAP = {
+    'pending': '⏳ Pending',
+    'under_review': '👁️ Under Review',
+    'approved': '✅ Approved',
+    'rejected': '❌ Rejected',
+    'archived': '📦 Archived'
+}
+
+# Media row backgrounds by approval status
+_STATUS_BG = {
+    'approved': QColor(Qt.green).lighter(180),
+    'rejected': QColor(Qt.red).lighter(180),
+    'under_review': QColor(Qt.yellow).lighter(180)
+}
+
+# Group header background
+_GROUP_BG = QColor(Qt.lightGray)
+
+
+@dataclass(frozen=True, slots=True)
+class MediaRow:
+    """A media item with its sort and display fields; the item itself is left unmodified."""
+
+    item: Dict[str, Any]
+    sort_key: Tuple[str, int]  # (created date sort key, version number)
+    sequence: str
+    icon: str
+    status_display: str
+    display_name: str
+
+
+def _make_group_font() -> QFont:
+    """Build the bold font used for sequence group headers."""
+    font = QFont()
+    font.setBold(True)
+    font.setPointSize(11)
+    return font
+
+
+class GroupedMediaModel(QAbstractItemModel):
+    """
+    Qt model for sequence-grouped media display.
+
+    Top-level rows are sequence group headers; their children are MediaRow
+    records built by GroupedMediaWidget._prepare_items.
+    Child indexes carry their group row + 1 as internal id, group headers carry 0.
+    """
+
+    # Column headers
+    COLUMNS = ["Media Files", "Version", "Status", "Author"]
+
+    # Media row backgrounds by approval status
+    STATUS_COLORS = _STATUS_BG
+
+    # Shared group header font
+    _GROUP_FONT = _make_group_font()
+
+    def __init__(self, parent=None):
+        """Initialize grouped media model."""
+        super().__init__(parent)
+        self._groups: List[Tuple[str, List[MediaRow]]] = []
+
+    def set_groups(self, groups: List[Tuple[str, List[MediaRow]]]):
+        """Replace all rows with (sequence, media_rows) groups."""
+        self.beginResetModel()
+        self._groups = groups
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all rows."""
+        self.set_groups([])
+
+    def media_item(self, index: QModelIndex) -> Optional[Dict[str, Any]]:
+        """Get the media item for an index, or None for group headers."""
+        if not index.isValid() or not index.internalId():
+            return None
+        return self._groups[index.internalId() - 1][1][index.row()].item
+
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        """Return the index for row/column under parent."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if parent.isValid():
+            return self.createIndex(row, column, parent.row() + 1)
+        return self.createIndex(row, column, 0)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Return the group header index for media rows."""
+        if not index.isValid() or not index.internalId():
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return number of groups, or media items in a group."""
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.internalId() or parent.column() > 0:
+            return 0
+        return len(self._groups[parent.row()][1])
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Return number of columns."""
+        return len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """Return header data."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Return item flags; group headers are not selectable."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if not index.internalId():
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return data for the given index and role."""
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if not index.internalId():
+            return self._group_data(index.row(), column, role)
+
+        row = self._groups[index.internalId() - 1][1][index.row()]
+        if role == Qt.DisplayRole:
+            return self._media_display(row, column)
+        if role == Qt.BackgroundRole:
+            return _STATUS_BG.get(row.item.get('approval_status', 'pending'))
+        if role == Qt.UserRole:
+            return row.item
+        return None
+
+    def _group_data(self, row: int, column: int, role: int) -> Any:
+        """Return data for a sequence group header."""
+        if role == Qt.DisplayRole:
+            if column:
+                return ""
+            sequence, items = self._groups[row]
+            return f"📁 {sequence.upper()} - Sequence {sequence[2:]} ({len(items)} files)"
+        if role == Qt.BackgroundRole:
+            return _GROUP_BG
+        if role == Qt.FontRole and column == 0:
+            return self._GROUP_FONT
+        return None
+
+    def _media_display(self, row: MediaRow, column: int) -> str:
+        """Return display text for a media row column."""
+        if column == 0:
+            return f"{row.icon} {row.display_name}"
+        if column == 1:
+            return row.item.get('version', 'v001')
+        if column == 2:
+            return row.status_display
+        return row.item.get('author', 'Unknown')
+
+    @staticmethod
+    def format_status_display(status: str) -> str:
+        """Format status with appropriate emoji."""
+        return _STATUS_MAP.get(status) or f"❓ {status.title()}"
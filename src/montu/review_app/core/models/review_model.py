@@ -7,8 +7,10 @@ annotation handling, and approval workflow operations.
 
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 # Add src to path for imports
@@ -17,6 +19,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from montu.shared.json_database import JSONDatabase
 
 
+# Media query results are reused for this many seconds, so bursts of refreshes share one query
+_MEDIA_CACHE_TTL = 2.0
+_MEDIA_CACHE_SIZE = 16
+
+
 class ReviewModel:
     """
     Review model for managing media files, annotations, and approval workflows.
@@ -28,6 +35,11 @@ class ReviewModel:
         """Initialize review model."""
         self.db = JSONDatabase()
         self.current_project_id: Optional[str] = None
+        
+        # (project_id, frozen filters) -> (load time, media items), oldest entry first
+        self._media_cache: Dict[Tuple[str, frozenset], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._media_cache_lock = threading.Lock()  # media loads run on pool threads
+        self._media_cache_generation = 0  # bumped on invalidation so in-flight loads are not cached
     
     def get_available_projects(self) -> List[Dict[str, Any]]:
         """Get list of available projects."""
@@ -43,7 +55,19 @@ class ReviewModel:
         self.current_project_id = project_id
     
     def get_media_for_project(self, project_id: str, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """Get media files for a specific project from media_records database with optional filtering."""
+        """
+        Get media files for a specific project from media_records database with optional filtering.
+        
+        Each call returns its own copies of the media item dicts, so callers may annotate them.
+        """
+        cache_key = (project_id, frozenset(filters.items()) if filters else frozenset())
+        now = time.monotonic()
+        with self._media_cache_lock:
+            cached = self._media_cache.get(cache_key)
+            generation = self._media_cache_generation
+        if cached and now - cached[0] < _MEDIA_CACHE_TTL:
+            return [dict(item) for item in cached[1]]
+        
         try:
             # Get all media records from database
             all_media_records = self.db.find('media_records', {})
@@ -70,7 +94,15 @@ class ReviewModel:
                 media_items = self.apply_media_filters(media_items, filters)
 
             print(f"Found {len(media_items)} media records for project {project_id}")
-            return media_items
+            
+            # Cache the result unless data changed while loading, evicting the oldest entry when full
+            with self._media_cache_lock:
+                if generation == self._media_cache_generation:
+                    self._media_cache.pop(cache_key, None)
+                    if len(self._media_cache) >= _MEDIA_CACHE_SIZE:
+                        del self._media_cache[next(iter(self._media_cache))]
+                    self._media_cache[cache_key] = (now, media_items)
+            return [dict(item) for item in media_items]
 
         except Exception as e:
             print(f"Error loading media for project {project_id}: {e}")
@@ -265,6 +297,7 @@ class ReviewModel:
     
     def add_annotation(self, media_item: Dict[str, Any], annotation: Dict[str, Any]):
         """Add annotation to media item."""
+        self.invalidate_media_cache()
         try:
             # In a full implementation, this would save to database
             # For demo purposes, we'll just log the annotation
@@ -286,8 +319,15 @@ class ReviewModel:
         except Exception as e:
             print(f"Error adding annotation: {e}")
     
+    def invalidate_media_cache(self):
+        """Drop cached media query results after media data changes."""
+        with self._media_cache_lock:
+            self._media_cache.clear()
+            self._media_cache_generation += 1
+    
     def update_approval_status(self, media_item: Dict[str, Any], approval_data: Dict[str, Any]):
         """Update approval status for media item."""
+        self.invalidate_media_cache()
         try:
             task_id = media_item.get('task_id', 'unknown')
             status = approval_data.get('status', 'pending')
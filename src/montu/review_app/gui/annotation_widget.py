@@ -5,15 +5,70 @@ Widget for adding and managing review annotations with drawing tools,
 text notes, and frame-specific feedback for the Review Application.
 """
 
-from typing import Dict, List, Any, Optional
+import bisect
+import itertools
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional, Iterator
 from datetime import datetime
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
     QGroupBox, QLabel, QComboBox, QListWidget, QListWidgetItem,
     QSpinBox, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Signal, QTimer
+from PySide6.QtGui import QBrush, QColor
+
+# Per-process prefix so counter-based annotation ids stay unique across sessions
+_SESSION_ID = uuid.uuid4().hex[:8]
+
+# List suffix for annotations that are not tied to a frame
+_GENERAL_SUFFIX = " [General]"
+
+# Frame index key for annotations that are not tied to a frame
+_GENERAL_FRAME_KEY = -1
+
+# Widget stylesheet, applied once to the whole annotation widget
+_STYLESHEET = """
+    QPushButton#addAnnotationButton {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QPushButton#deleteAnnotationButton {
+        background-color: #f44336;
+        color: white;
+    }
+    QPushButton#clearAllAnnotationsButton {
+        background-color: #ff9800;
+        color: white;
+    }
+    QLabel#annotationStatsLabel {
+        color: #666;
+        font-size: 9pt;
+    }
+"""
+
+
+@dataclass(slots=True)
+class Annotation:
+    """Review annotation on a media item."""
+    id: str
+    text: str
+    type: str
+    priority: str
+    frame_specific: bool
+    frame_number: Optional[int]
+    timestamp_ns: int  # nanoseconds since the epoch
+    author: str
+    status: str = 'open'
+    _display: Optional[str] = field(default=None, repr=False, compare=False)  # cached list text
+    
+    @property
+    def timestamp(self) -> str:
+        """Creation time as a local ISO 8601 string."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
 
 
 class AnnotationWidget(QWidget):
@@ -25,26 +80,49 @@ class AnnotationWidget(QWidget):
     """
     
     # Signals
-    annotationAdded = Signal(dict)      # annotation_data
-    annotationUpdated = Signal(dict)    # annotation_data
+    annotationAdded = Signal(str)       # annotation_id
+    annotationUpdated = Signal(str)     # annotation_id
     annotationDeleted = Signal(str)     # annotation_id
     
     # Annotation types
-    ANNOTATION_TYPES = [
+    ANNOTATION_TYPES = (
         ('Note', 'note'),
         ('Issue', 'issue'),
         ('Approval', 'approval'),
         ('Question', 'question'),
         ('Change Request', 'change_request')
-    ]
+    )
     
     # Priority levels
-    PRIORITY_LEVELS = [
+    PRIORITY_LEVELS = (
         ('Low', 'low'),
         ('Medium', 'medium'),
         ('High', 'high'),
         ('Critical', 'critical')
-    ]
+    )
+    
+    # Annotation id sequence, shared by all widgets in this process
+    _id_counter = itertools.count(1)
+    
+    # Display names by value
+    _TYPE_DISPLAY = {value: display_name for display_name, value in ANNOTATION_TYPES}
+    _PRIORITY_DISPLAY = {value: display_name for display_name, value in PRIORITY_LEVELS}
+    
+    # Combo box indices by value
+    _TYPE_INDEX = {value: index for index, (_, value) in enumerate(ANNOTATION_TYPES)}
+    _PRIORITY_INDEX = {value: index for index, (_, value) in enumerate(PRIORITY_LEVELS)}
+    
+    # List text truncation
+    _TEXT_LIMIT = 40
+    _TEXT_CUT = 37
+    _ELLIPSIS = '…'
+    
+    # List row background by priority, shared by every row
+    _PRIORITY_BRUSH = {
+        'critical': QBrush(QColor(255, 235, 235)),  # Light red
+        'high': QBrush(QColor(255, 245, 235)),      # Light orange
+        'low': QBrush(QColor(235, 255, 235))        # Light green
+    }
     
     def __init__(self, parent=None):
         """Initialize annotation widget."""
@@ -53,16 +131,56 @@ class AnnotationWidget(QWidget):
         # State
         self.current_media_item: Optional[Dict[str, Any]] = None
         self.current_frame = 0
-        self.annotations: List[Dict[str, Any]] = []
+        self._annotations_by_id: Dict[str, Annotation] = {}  # insertion-ordered
         self.selected_annotation_id: Optional[str] = None
+        self._row_ids: List[str] = []  # annotation id per list row
+        
+        # Annotations sorted by frame, with a parallel list of their frame keys
+        self._frame_keys: List[int] = []
+        self._by_frame: List[Annotation] = []
+        self._priority_counts: Counter = Counter()
+        
+        # Frame window shown in the list; None means no limit
+        self._view_frame_min: Optional[int] = None
+        self._view_frame_max: Optional[int] = None
+        
+        # The annotations list group is built on first show
+        self._annotations_built = False
+        
+        # Statistics changed while hidden are shown on the next showEvent
+        self._stats_dirty = False
+        
+        # Coalesce display refreshes from several mutations in one event-loop pass
+        self._needs_rebuild = False
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(0)
+        self.refresh_timer.timeout.connect(self._do_refresh)
         
         # Setup UI
         self.setup_ui()
         self.setup_connections()
     
+    @property
+    def annotations(self) -> List[Annotation]:
+        """Annotations for the current media item, in insertion order."""
+        return list(self._annotations_by_id.values())
+    
+    def get_annotation(self, annotation_id: str) -> Optional[Annotation]:
+        """Get an annotation by id."""
+        return self._annotations_by_id.get(annotation_id)
+    
+    def get_annotation_data(self, annotation_id: str) -> Optional[Dict[str, Any]]:
+        """Get an annotation by id as a plain dictionary."""
+        annotation = self._annotations_by_id.get(annotation_id)
+        if annotation is None:
+            return None
+        return self._serialize_annotation(annotation)
+    
     def setup_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
+        self.main_layout = layout
         
         # Annotation tools
         tools_group = QGroupBox("Annotation Tools")
@@ -81,7 +199,7 @@ class AnnotationWidget(QWidget):
         self.priority_combo = QComboBox()
         for display_name, value in self.PRIORITY_LEVELS:
             self.priority_combo.addItem(display_name, value)
-        self.priority_combo.setCurrentIndex(1)  # Default to Medium
+        self.priority_combo.setCurrentIndex(self._PRIORITY_INDEX['medium'])
         type_layout.addWidget(self.priority_combo)
         
         tools_layout.addLayout(type_layout)
@@ -114,7 +232,8 @@ class AnnotationWidget(QWidget):
         buttons_layout = QHBoxLayout()
         
         self.add_annotation_button = QPushButton("Add Annotation")
-        self.add_annotation_button.setStyleSheet("background-color: #4CAF50; color: white;")
+        self.add_annotation_button.setEnabled(False)
+        self.add_annotation_button.setObjectName("addAnnotationButton")
         buttons_layout.addWidget(self.add_annotation_button)
         
         self.clear_text_button = QPushButton("Clear")
@@ -123,6 +242,18 @@ class AnnotationWidget(QWidget):
         tools_layout.addLayout(buttons_layout)
         layout.addWidget(tools_group)
         
+        # Annotation statistics
+        self.stats_label = QLabel("No annotations")
+        self.stats_label.setObjectName("annotationStatsLabel")
+        layout.addWidget(self.stats_label)
+        
+        # Add stretch to push content to top
+        layout.addStretch()
+        
+        self.setStyleSheet(_STYLESHEET)
+    
+    def _build_annotations_group(self):
+        """Build the existing annotations list group."""
         # Existing annotations list
         annotations_group = QGroupBox("Annotations")
         annotations_layout = QVBoxLayout(annotations_group)
@@ -137,40 +268,47 @@ class AnnotationWidget(QWidget):
         
         self.delete_annotation_button = QPushButton("Delete")
         self.delete_annotation_button.setEnabled(False)
-        self.delete_annotation_button.setStyleSheet("background-color: #f44336; color: white;")
+        self.delete_annotation_button.setObjectName("deleteAnnotationButton")
         manage_layout.addWidget(self.delete_annotation_button)
         
         self.clear_all_button = QPushButton("Clear All")
-        self.clear_all_button.setStyleSheet("background-color: #ff9800; color: white;")
+        self.clear_all_button.setObjectName("clearAllAnnotationsButton")
         manage_layout.addWidget(self.clear_all_button)
         
         manage_layout.addStretch()
         annotations_layout.addLayout(manage_layout)
-        layout.addWidget(annotations_group)
         
-        # Annotation statistics
-        self.stats_label = QLabel("No annotations")
-        self.stats_label.setStyleSheet("color: #666; font-size: 9pt;")
-        layout.addWidget(self.stats_label)
+        # Place between the tools group and the statistics label
+        self.main_layout.insertWidget(1, annotations_group)
         
-        # Add stretch to push content to top
-        layout.addStretch()
+        # Annotations list
+        self.annotations_list.itemSelectionChanged.connect(self.on_annotation_selected)
+        
+        # Management buttons
+        self.delete_annotation_button.clicked.connect(self.delete_selected_annotation)
+        self.clear_all_button.clicked.connect(self.clear_all_annotations)
+        
+        self._annotations_built = True
+        self.refresh_annotations_list()
+    
+    def showEvent(self, event):
+        """Build the annotations list group on first show and flush stale statistics."""
+        super().showEvent(event)
+        if not self._annotations_built:
+            self._build_annotations_group()
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self.update_statistics()
     
     def setup_connections(self):
         """Set up signal connections."""
         # Annotation tools
+        self.annotation_text.textChanged.connect(self._update_add_enabled)
         self.add_annotation_button.clicked.connect(self.add_annotation)
         self.clear_text_button.clicked.connect(self.clear_annotation_text)
         
         # Frame-specific checkbox
         self.frame_specific_checkbox.toggled.connect(self.on_frame_specific_toggled)
-        
-        # Annotations list
-        self.annotations_list.itemSelectionChanged.connect(self.on_annotation_selected)
-        
-        # Management buttons
-        self.delete_annotation_button.clicked.connect(self.delete_selected_annotation)
-        self.clear_all_button.clicked.connect(self.clear_all_annotations)
     
     def set_media_item(self, media_item: Dict[str, Any]):
         """Set the current media item and load its annotations."""
@@ -186,19 +324,108 @@ class AnnotationWidget(QWidget):
         self.current_frame = frame
         self.frame_spinbox.setValue(frame)
     
+    def set_visible_frame_range(self, frame_min: Optional[int], frame_max: Optional[int]):
+        """
+        Limit listed frame-specific annotations to a frame window.
+        
+        General annotations are always listed. Pass None for either bound
+        to leave that side of the window open.
+        """
+        if (frame_min, frame_max) == (self._view_frame_min, self._view_frame_max):
+            return
+        
+        self._view_frame_min = frame_min
+        self._view_frame_max = frame_max
+        self._schedule_refresh(rebuild=True)
+    
+    def _is_in_view(self, annotation: Annotation) -> bool:
+        """Check whether an annotation falls inside the visible frame window."""
+        frame_number = annotation.frame_number
+        if not annotation.frame_specific or frame_number is None:
+            return True
+        if self._view_frame_min is not None and frame_number < self._view_frame_min:
+            return False
+        if self._view_frame_max is not None and frame_number > self._view_frame_max:
+            return False
+        return True
+    
+    def annotations_for_frame_range(self, frame_min: Optional[int],
+                                    frame_max: Optional[int]) -> Iterator[Annotation]:
+        """
+        Iterate frame-specific annotations with frame_min <= frame <= frame_max, in frame order.
+        
+        Pass None for either bound to leave that side of the range open.
+        """
+        start = bisect.bisect_left(self._frame_keys, max(frame_min or 0, 0))
+        if frame_max is None:
+            end = len(self._frame_keys)
+        else:
+            end = bisect.bisect_right(self._frame_keys, frame_max)
+        return iter(self._by_frame[start:end])
+    
+    def _visible_annotations(self) -> Iterator[Annotation]:
+        """Iterate listed annotations; with a frame window, general ones come first, then frame order."""
+        if self._view_frame_min is None and self._view_frame_max is None:
+            return iter(self._annotations_by_id.values())
+        
+        # General annotations sort before every frame in the index
+        general_end = bisect.bisect_left(self._frame_keys, 0)
+        return itertools.chain(
+            self._by_frame[:general_end],
+            self.annotations_for_frame_range(self._view_frame_min, self._view_frame_max)
+        )
+    
+    @staticmethod
+    def _frame_key(annotation: Annotation) -> int:
+        """Get the frame index key for an annotation."""
+        if annotation.frame_specific and annotation.frame_number is not None:
+            return annotation.frame_number
+        return _GENERAL_FRAME_KEY
+    
+    def _rebuild_frame_index(self):
+        """Rebuild the frame index from all annotations."""
+        self._by_frame = sorted(self._annotations_by_id.values(), key=self._frame_key)
+        self._frame_keys = [self._frame_key(annotation) for annotation in self._by_frame]
+    
+    def _index_annotation(self, annotation: Annotation):
+        """Insert an annotation into the frame index."""
+        key = self._frame_key(annotation)
+        position = bisect.bisect_right(self._frame_keys, key)
+        self._frame_keys.insert(position, key)
+        self._by_frame.insert(position, annotation)
+    
+    def _unindex_annotation(self, annotation: Annotation):
+        """Remove an annotation from the frame index."""
+        key = self._frame_key(annotation)
+        start = bisect.bisect_left(self._frame_keys, key)
+        end = bisect.bisect_right(self._frame_keys, key)
+        for position in range(start, end):
+            if self._by_frame[position] is annotation:
+                del self._frame_keys[position]
+                del self._by_frame[position]
+                return
+    
     def load_annotations(self):
         """Load annotations for current media item."""
         if not self.current_media_item:
-            self.annotations = []
+            self._annotations_by_id = {}
         else:
             # In a full implementation, this would load from database
             # For demo purposes, we'll start with empty annotations
-            self.annotations = []
+            self._annotations_by_id = {}
         
-        self.refresh_annotations_list()
+        self._priority_counts = Counter(
+            annotation.priority for annotation in self._annotations_by_id.values()
+        )
+        self._rebuild_frame_index()
+        self._schedule_refresh(rebuild=True)
     
     def add_annotation(self):
         """Add new annotation."""
+        # The Add button is disabled for an empty document; this guards direct calls
+        if self.annotation_text.document().isEmpty():
+            return
+        
         text = self.annotation_text.toPlainText().strip()
         if not text:
             return
@@ -209,46 +436,63 @@ class AnnotationWidget(QWidget):
         frame_number = self.frame_spinbox.value() if frame_specific else None
         
         # Create annotation data
-        annotation = {
-            'id': f"ann_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
-            'text': text,
-            'type': annotation_type,
-            'priority': priority,
-            'frame_specific': frame_specific,
-            'frame_number': frame_number,
-            'timestamp': datetime.now().isoformat(),
-            'author': 'Current User',
-            'status': 'open'
-        }
-        
-        # Add to annotations list
-        self.annotations.append(annotation)
-        
-        # Refresh display
-        self.refresh_annotations_list()
+        annotation = Annotation(
+            id=f"ann_{_SESSION_ID}_{next(self._id_counter):06d}",
+            text=text,
+            type=annotation_type,
+            priority=priority,
+            frame_specific=frame_specific,
+            frame_number=frame_number,
+            timestamp_ns=time.time_ns(),
+            author='Current User'
+        )
+        
+        # Cached list text; a derived view, not part of the persisted annotation
+        annotation._display = self.format_annotation_text(annotation)
+        
+        # Add to annotations
+        self._annotations_by_id[annotation.id] = annotation
+        self._index_annotation(annotation)
+        self._priority_counts[priority] += 1
+        
+        # Update display; a frame window lists rows in frame order, so rebuild it
+        if not self._annotations_built or not self._is_in_view(annotation):
+            self._schedule_refresh()
+        elif self._view_frame_min is None and self._view_frame_max is None:
+            self._append_list_item(annotation)
+            self._schedule_refresh()
+        else:
+            self._schedule_refresh(rebuild=True)
         
         # Clear text
         self.clear_annotation_text()
         
         # Emit signal
-        self.annotationAdded.emit(annotation)
+        self.annotationAdded.emit(annotation.id)
     
     def delete_selected_annotation(self):
         """Delete the selected annotation."""
-        if not self.selected_annotation_id:
+        annotation_id = self.selected_annotation_id
+        if not annotation_id:
             return
         
-        # Find and remove annotation
-        for i, annotation in enumerate(self.annotations):
-            if annotation['id'] == self.selected_annotation_id:
-                self.annotations.pop(i)
-                break
-        
-        # Refresh display
-        self.refresh_annotations_list()
+        # Remove annotation and its list row
+        annotation = self._annotations_by_id.pop(annotation_id, None)
+        if annotation is not None:
+            self._unindex_annotation(annotation)
+            priority = annotation.priority
+            self._priority_counts[priority] -= 1
+            if self._priority_counts[priority] <= 0:
+                del self._priority_counts[priority]
+        if annotation_id in self._row_ids:
+            row = self._row_ids.index(annotation_id)
+            del self._row_ids[row]
+            self.annotations_list.takeItem(row)
+        
+        self._schedule_refresh()
         
         # Emit signal
-        self.annotationDeleted.emit(self.selected_annotation_id)
+        self.annotationDeleted.emit(annotation_id)
         
         # Clear selection
         self.selected_annotation_id = None
@@ -256,61 +500,121 @@ class AnnotationWidget(QWidget):
     
     def clear_all_annotations(self):
         """Clear all annotations."""
-        self.annotations.clear()
-        self.refresh_annotations_list()
+        self._annotations_by_id.clear()
+        self._frame_keys.clear()
+        self._by_frame.clear()
+        self._priority_counts.clear()
+        self._schedule_refresh(rebuild=True)
         
         # Clear selection
         self.selected_annotation_id = None
-        self.delete_annotation_button.setEnabled(False)
+        if self._annotations_built:
+            self.delete_annotation_button.setEnabled(False)
+    
+    def _update_add_enabled(self):
+        """Enable the Add button only while there is annotation text."""
+        self.add_annotation_button.setEnabled(not self.annotation_text.document().isEmpty())
     
     def clear_annotation_text(self):
         """Clear the annotation text field."""
         self.annotation_text.clear()
     
     def refresh_annotations_list(self):
-        """Refresh the annotations list display."""
-        self.annotations_list.clear()
-        
-        for annotation in self.annotations:
-            item_text = self.format_annotation_text(annotation)
-            list_item = QListWidgetItem(item_text)
-            list_item.setData(Qt.UserRole, annotation['id'])
-            
-            # Color code by priority
-            priority = annotation.get('priority', 'medium')
-            if priority == 'critical':
-                list_item.setBackground(QColor(255, 235, 235))  # Light red
-            elif priority == 'high':
-                list_item.setBackground(QColor(255, 245, 235))  # Light orange
-            elif priority == 'low':
-                list_item.setBackground(QColor(235, 255, 235))  # Light green
-            
-            self.annotations_list.addItem(list_item)
+        """Rebuild the annotations list display from scratch, immediately."""
+        self.refresh_timer.stop()
+        self._needs_rebuild = False
+        if self._annotations_built:
+            self._bulk_populate(self._visible_annotations())
         
         # Update statistics
-        self.update_statistics()
+        self._stats_dirty = True
+        self._maybe_update_stats()
+    
+    def _schedule_refresh(self, rebuild: bool = False):
+        """Queue a statistics update, and optionally a list rebuild, for the next event-loop pass."""
+        if rebuild:
+            self._needs_rebuild = True
+        self._stats_dirty = True
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+    
+    def _do_refresh(self):
+        """Apply the display refresh queued by _schedule_refresh."""
+        if self._needs_rebuild:
+            self.refresh_annotations_list()
+        else:
+            self._maybe_update_stats()
+    
+    def _maybe_update_stats(self):
+        """Update statistics if they changed and the widget is visible."""
+        if self._stats_dirty and self.isVisible():
+            self._stats_dirty = False
+            self.update_statistics()
+    
+    def _bulk_populate(self, annotations):
+        """Replace all list rows with a single repaint and no per-row signals."""
+        self.annotations_list.setUpdatesEnabled(False)
+        self.annotations_list.blockSignals(True)
+        try:
+            self.annotations_list.clear()
+            self._row_ids.clear()
+            for annotation in annotations:
+                self._append_list_item(annotation)
+        finally:
+            self.annotations_list.blockSignals(False)
+            self.annotations_list.setUpdatesEnabled(True)
+            self.annotations_list.viewport().update()
+        
+        # Selection changes were blocked, so resync selection state once
+        self.on_annotation_selected()
+    
+    def _append_list_item(self, annotation: Annotation):
+        """Append a single annotation row to the list."""
+        item_text = annotation._display
+        if item_text is None:
+            item_text = annotation._display = self.format_annotation_text(annotation)
+        list_item = QListWidgetItem(item_text)
+        
+        # Color code by priority
+        brush = self._PRIORITY_BRUSH.get(annotation.priority)
+        if brush is not None:
+            list_item.setBackground(brush)
+        
+        self.annotations_list.addItem(list_item)
+        self._row_ids.append(annotation.id)
+    
+    def _serialize_annotation(self, annotation: Annotation) -> Dict[str, Any]:
+        """Return annotation data without cached display fields, with an ISO timestamp."""
+        data = {}
+        for key, value in asdict(annotation).items():
+            if key == 'timestamp_ns':
+                data['timestamp'] = annotation.timestamp
+            elif not key.startswith('_'):
+                data[key] = value
+        return data
     
-    def format_annotation_text(self, annotation: Dict[str, Any]) -> str:
+    def format_annotation_text(self, annotation: Annotation) -> str:
         """Format annotation for display in list."""
-        text = annotation['text']
-        if len(text) > 40:
-            text = text[:37] + "..."
+        text = annotation.text
+        if len(text) > self._TEXT_LIMIT:
+            text = f"{text[:self._TEXT_CUT]}{self._ELLIPSIS}"
         
-        annotation_type = annotation['type'].replace('_', ' ').title()
-        priority = annotation['priority'].title()
+        annotation_type = self._TYPE_DISPLAY.get(annotation.type) or annotation.type.replace('_', ' ').title()
+        priority = self._PRIORITY_DISPLAY.get(annotation.priority) or annotation.priority.title()
         
-        if annotation['frame_specific'] and annotation['frame_number'] is not None:
-            frame_info = f" [F{annotation['frame_number']}]"
+        frame_number = annotation.frame_number
+        if annotation.frame_specific and frame_number is not None:
+            frame_info = f" [F{frame_number}]"
         else:
-            frame_info = " [General]"
+            frame_info = _GENERAL_SUFFIX
         
         return f"{annotation_type} ({priority}){frame_info}: {text}"
     
     def on_annotation_selected(self):
         """Handle annotation selection change."""
-        current_item = self.annotations_list.currentItem()
-        if current_item:
-            self.selected_annotation_id = current_item.data(Qt.UserRole)
+        row = self.annotations_list.currentRow()
+        if 0 <= row < len(self._row_ids):
+            self.selected_annotation_id = self._row_ids[row]
             self.delete_annotation_button.setEnabled(True)
         else:
             self.selected_annotation_id = None
@@ -324,16 +628,13 @@ class AnnotationWidget(QWidget):
     
     def update_statistics(self):
         """Update annotation statistics display."""
-        total = len(self.annotations)
+        total = len(self._annotations_by_id)
         if total == 0:
             self.stats_label.setText("No annotations")
             return
         
-        # Count by priority
-        priority_counts = {}
-        for annotation in self.annotations:
-            priority = annotation['priority']
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
+        # Count by priority (maintained incrementally on add/delete)
+        priority_counts = self._priority_counts
         
         # Format statistics
         stats_text = f"Total: {total}"
@@ -5,15 +5,69 @@ Widget for managing approval workflow with status tracking,
 supervisor notes, and client version mapping for the Review Application.
 """
 
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
-    QGroupBox, QLabel, QComboBox, QListWidget, QListWidgetItem,
+    QGroupBox, QLabel, QComboBox, QListView,
     QCheckBox, QFrame
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
+
+from ..core.models.approval_history_model import ApprovalHistoryModel
+
+# Widget stylesheet, applied once to the whole approval widget.
+# The status label color is selected by its statusClass property.
+_STYLESHEET = """
+    QLabel#currentStatusLabel {
+        font-weight: bold;
+        font-size: 10pt;
+    }
+    QLabel#currentStatusLabel[statusClass="default"] { color: #2196F3; }
+    QLabel#currentStatusLabel[statusClass="approved"] { color: #4CAF50; }
+    QLabel#currentStatusLabel[statusClass="rejected"] { color: #f44336; }
+    QLabel#currentStatusLabel[statusClass="revision"] { color: #ff9800; }
+    QLabel#statusDetailsLabel {
+        color: #666;
+        font-size: 9pt;
+    }
+    QPushButton#updateApprovalButton {
+        background-color: #2196F3;
+        color: white;
+    }
+    QPushButton#approveButton {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QPushButton#rejectButton {
+        background-color: #f44336;
+        color: white;
+    }
+    QPushButton#needsRevisionButton {
+        background-color: #ff9800;
+        color: white;
+    }
+"""
+
+
+@contextmanager
+def _block_signals(*widgets):
+    """Block signals on the given widgets, restoring their previous state on exit."""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
+
+def _populate_combo(combo: QComboBox, options):
+    """Fill a combo box from (display_name, value) pairs in one batch."""
+    with _block_signals(combo):
+        combo.addItems([display_name for display_name, _ in options])
+        for index, (_, value) in enumerate(options):
+            combo.setItemData(index, value)
 
 
 class ApprovalWidget(QWidget):
@@ -26,9 +80,10 @@ class ApprovalWidget(QWidget):
     
     # Signals
     approvalChanged = Signal(dict)      # approval_data
+    approvalDelta = Signal(dict)        # changed fields and new history entry
     
     # Approval statuses
-    APPROVAL_STATUSES = [
+    APPROVAL_STATUSES = (
         ('Pending Review', 'pending'),
         ('Approved', 'approved'),
         ('Approved with Notes', 'approved_with_notes'),
@@ -36,7 +91,27 @@ class ApprovalWidget(QWidget):
         ('Needs Revision', 'needs_revision'),
         ('Client Review', 'client_review'),
         ('Final Approved', 'final_approved')
-    ]
+    )
+    
+    # Client version options
+    CLIENT_VERSIONS = (
+        ('Auto-assign', 'auto'),
+        ('v1.0', 'v1.0'),
+        ('v1.1', 'v1.1'),
+        ('v2.0', 'v2.0')
+    )
+    
+    # Status label style class by approval status
+    _STATUS_CLASS = {
+        'approved': 'approved',
+        'final_approved': 'approved',
+        'rejected': 'rejected',
+        'needs_revision': 'revision'
+    }
+    
+    # Combo box indices by value
+    _STATUS_INDEX = {value: index for index, (_, value) in enumerate(APPROVAL_STATUSES)}
+    _CLIENT_VERSION_INDEX = {value: index for index, (_, value) in enumerate(CLIENT_VERSIONS)}
     
     def __init__(self, parent=None):
         """Initialize approval widget."""
@@ -46,6 +121,12 @@ class ApprovalWidget(QWidget):
         self.current_media_item: Optional[Dict[str, Any]] = None
         self.current_approval_data: Dict[str, Any] = {}
         
+        # Enable the Update button once typing in the notes pauses
+        self.notes_timer = QTimer()
+        self.notes_timer.setSingleShot(True)
+        self.notes_timer.setInterval(150)
+        self.notes_timer.timeout.connect(self._enable_update_button)
+        
         # Setup UI
         self.setup_ui()
         self.setup_connections()
@@ -59,16 +140,14 @@ class ApprovalWidget(QWidget):
         status_layout = QVBoxLayout(status_group)
         
         self.current_status_label = QLabel("No media selected")
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(10)
-        self.current_status_label.setFont(font)
         self.current_status_label.setAlignment(Qt.AlignCenter)
+        self.current_status_label.setObjectName("currentStatusLabel")
+        self.current_status_label.setProperty("statusClass", "")
         status_layout.addWidget(self.current_status_label)
         
         # Status details
         self.status_details_label = QLabel("Select media to view approval status")
-        self.status_details_label.setStyleSheet("color: #666; font-size: 9pt;")
+        self.status_details_label.setObjectName("statusDetailsLabel")
         self.status_details_label.setAlignment(Qt.AlignCenter)
         self.status_details_label.setWordWrap(True)
         status_layout.addWidget(self.status_details_label)
@@ -84,8 +163,7 @@ class ApprovalWidget(QWidget):
         status_layout.addWidget(QLabel("Status:"))
         
         self.status_combo = QComboBox()
-        for display_name, value in self.APPROVAL_STATUSES:
-            self.status_combo.addItem(display_name, value)
+        _populate_combo(self.status_combo, self.APPROVAL_STATUSES)
         status_layout.addWidget(self.status_combo)
         
         controls_layout.addLayout(status_layout)
@@ -111,10 +189,7 @@ class ApprovalWidget(QWidget):
         client_version_layout.addWidget(QLabel("Client Version:"))
         
         self.client_version_combo = QComboBox()
-        self.client_version_combo.addItem("Auto-assign", "auto")
-        self.client_version_combo.addItem("v1.0", "v1.0")
-        self.client_version_combo.addItem("v1.1", "v1.1")
-        self.client_version_combo.addItem("v2.0", "v2.0")
+        _populate_combo(self.client_version_combo, self.CLIENT_VERSIONS)
         self.client_version_combo.setEnabled(False)
         client_version_layout.addWidget(self.client_version_combo)
         
@@ -125,7 +200,7 @@ class ApprovalWidget(QWidget):
         buttons_layout = QHBoxLayout()
         
         self.update_approval_button = QPushButton("Update Approval")
-        self.update_approval_button.setStyleSheet("background-color: #2196F3; color: white;")
+        self.update_approval_button.setObjectName("updateApprovalButton")
         self.update_approval_button.setEnabled(False)
         buttons_layout.addWidget(self.update_approval_button)
         
@@ -139,7 +214,10 @@ class ApprovalWidget(QWidget):
         history_group = QGroupBox("Approval History")
         history_layout = QVBoxLayout(history_group)
         
-        self.history_list = QListWidget()
+        self.history_model = ApprovalHistoryModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self.history_model)
+        self.history_list.setUniformItemSizes(True)
         self.history_list.setMaximumHeight(120)
         history_layout.addWidget(self.history_list)
         
@@ -150,17 +228,17 @@ class ApprovalWidget(QWidget):
         quick_layout = QHBoxLayout(quick_group)
         
         self.approve_button = QPushButton("✓ Approve")
-        self.approve_button.setStyleSheet("background-color: #4CAF50; color: white;")
+        self.approve_button.setObjectName("approveButton")
         self.approve_button.setEnabled(False)
         quick_layout.addWidget(self.approve_button)
         
         self.reject_button = QPushButton("✗ Reject")
-        self.reject_button.setStyleSheet("background-color: #f44336; color: white;")
+        self.reject_button.setObjectName("rejectButton")
         self.reject_button.setEnabled(False)
         quick_layout.addWidget(self.reject_button)
         
         self.needs_revision_button = QPushButton("⚠ Needs Revision")
-        self.needs_revision_button.setStyleSheet("background-color: #ff9800; color: white;")
+        self.needs_revision_button.setObjectName("needsRevisionButton")
         self.needs_revision_button.setEnabled(False)
         quick_layout.addWidget(self.needs_revision_button)
         
@@ -168,6 +246,8 @@ class ApprovalWidget(QWidget):
         
         # Add stretch to push content to top
         layout.addStretch()
+        
+        self.setStyleSheet(_STYLESHEET)
     
     def setup_connections(self):
         """Set up signal connections."""
@@ -239,15 +319,13 @@ class ApprovalWidget(QWidget):
         status_display = status.replace('_', ' ').title()
         self.current_status_label.setText(f"{status_display}")
         
-        # Set status color
-        if status == 'approved' or status == 'final_approved':
-            self.current_status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-        elif status == 'rejected':
-            self.current_status_label.setStyleSheet("color: #f44336; font-weight: bold;")
-        elif status == 'needs_revision':
-            self.current_status_label.setStyleSheet("color: #ff9800; font-weight: bold;")
-        else:
-            self.current_status_label.setStyleSheet("color: #2196F3; font-weight: bold;")
+        # Set status color, repolishing only when the style class changes
+        status_class = self._STATUS_CLASS.get(status, 'default')
+        if self.current_status_label.property("statusClass") != status_class:
+            self.current_status_label.setProperty("statusClass", status_class)
+            style = self.current_status_label.style()
+            style.unpolish(self.current_status_label)
+            style.polish(self.current_status_label)
         
         # Update details
         details = f"Task: {task_id} | Version: {version}"
@@ -259,62 +337,37 @@ class ApprovalWidget(QWidget):
     
     def update_form_from_data(self):
         """Update form controls from current approval data."""
-        # Set status combo
-        status = self.current_approval_data.get('status', 'pending')
-        for i in range(self.status_combo.count()):
-            if self.status_combo.itemData(i) == status:
-                self.status_combo.setCurrentIndex(i)
-                break
-        
-        # Set supervisor notes
-        notes = self.current_approval_data.get('supervisor_notes', '')
-        self.supervisor_notes.setPlainText(notes)
-        
-        # Set client delivery options
-        client_delivery = self.current_approval_data.get('client_delivery', False)
-        self.client_delivery_checkbox.setChecked(client_delivery)
-        self.client_version_combo.setEnabled(client_delivery)
-        
-        client_version = self.current_approval_data.get('client_version', 'auto')
-        for i in range(self.client_version_combo.count()):
-            if self.client_version_combo.itemData(i) == client_version:
-                self.client_version_combo.setCurrentIndex(i)
-                break
+        # Programmatic changes should not trigger the edit handlers
+        with _block_signals(self.status_combo, self.supervisor_notes,
+                            self.client_delivery_checkbox, self.client_version_combo):
+            # Set status combo
+            status = self.current_approval_data.get('status', 'pending')
+            status_index = self._STATUS_INDEX.get(status)
+            if status_index is not None:
+                self.status_combo.setCurrentIndex(status_index)
+            
+            # Set supervisor notes
+            notes = self.current_approval_data.get('supervisor_notes', '')
+            self.supervisor_notes.setPlainText(notes)
+            
+            # Set client delivery options
+            client_delivery = self.current_approval_data.get('client_delivery', False)
+            self.client_delivery_checkbox.setChecked(client_delivery)
+            self.client_version_combo.setEnabled(client_delivery)
+            
+            client_version = self.current_approval_data.get('client_version', 'auto')
+            client_version_index = self._CLIENT_VERSION_INDEX.get(client_version)
+            if client_version_index is not None:
+                self.client_version_combo.setCurrentIndex(client_version_index)
+        
+        # The form now matches the stored data
+        self.notes_timer.stop()
+        self.update_approval_button.setEnabled(False)
     
     def update_history_display(self):
         """Update the approval history display."""
-        self.history_list.clear()
-        
         history = self.current_approval_data.get('history', [])
-        for entry in reversed(history):  # Show most recent first
-            timestamp = entry.get('timestamp', '')
-            status = entry.get('status', '').replace('_', ' ').title()
-            user = entry.get('user', 'Unknown')
-            notes = entry.get('notes', '')
-            
-            # Format timestamp
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_str = dt.strftime('%m/%d %H:%M')
-            except:
-                time_str = 'Unknown'
-            
-            # Create history item text
-            item_text = f"{time_str} - {status} by {user}"
-            if notes:
-                item_text += f": {notes[:50]}{'...' if len(notes) > 50 else ''}"
-            
-            list_item = QListWidgetItem(item_text)
-            
-            # Color code by status
-            if 'approved' in status.lower():
-                list_item.setBackground(QColor(235, 255, 235))  # Light green
-            elif 'rejected' in status.lower():
-                list_item.setBackground(QColor(255, 235, 235))  # Light red
-            elif 'revision' in status.lower():
-                list_item.setBackground(QColor(255, 245, 235))  # Light orange
-            
-            self.history_list.addItem(list_item)
+        self.history_model.set_history(history)
     
     def enable_controls(self, enabled: bool):
         """Enable or disable approval controls."""
@@ -322,23 +375,36 @@ class ApprovalWidget(QWidget):
         self.supervisor_notes.setEnabled(enabled)
         self.client_delivery_checkbox.setEnabled(enabled)
         self.update_approval_button.setEnabled(enabled)
+        if not enabled:
+            self.notes_timer.stop()
         self.approve_button.setEnabled(enabled)
         self.reject_button.setEnabled(enabled)
         self.needs_revision_button.setEnabled(enabled)
     
-    def on_status_changed(self):
+    @Slot(str)
+    def on_status_changed(self, text: str):
         """Handle status combo change."""
-        self.update_approval_button.setEnabled(True)
+        self._enable_update_button()
     
+    @Slot()
     def on_notes_changed(self):
         """Handle supervisor notes change."""
-        self.update_approval_button.setEnabled(True)
+        if not self.update_approval_button.isEnabled():
+            self.notes_timer.start()
     
+    @Slot(bool)
     def on_client_delivery_toggled(self, checked: bool):
         """Handle client delivery checkbox toggle."""
         self.client_version_combo.setEnabled(checked)
-        self.update_approval_button.setEnabled(True)
+        self._enable_update_button()
     
+    @Slot()
+    def _enable_update_button(self):
+        """Enable the Update button if it is not already enabled."""
+        if not self.update_approval_button.isEnabled():
+            self.update_approval_button.setEnabled(True)
+    
+    @Slot()
     def update_approval(self):
         """Update approval status with current form data."""
         if not self.current_media_item:
@@ -350,18 +416,19 @@ class ApprovalWidget(QWidget):
         client_delivery = self.client_delivery_checkbox.isChecked()
         client_version = self.client_version_combo.currentData() if client_delivery else None
         
-        # Update approval data
+        # Update approval data; history and last_updated share one ISO timestamp
+        now = datetime.now().isoformat()
         self.current_approval_data.update({
             'status': new_status,
             'supervisor_notes': supervisor_notes,
             'client_delivery': client_delivery,
             'client_version': client_version,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': now
         })
         
         # Add to history
         history_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now,
             'status': new_status,
             'user': 'Current User',
             'notes': supervisor_notes
@@ -373,33 +440,46 @@ class ApprovalWidget(QWidget):
         
         # Update displays
         self.update_status_display()
-        self.update_history_display()
+        self.history_model.add_entry(history_entry)
         
         # Disable update button
+        self.notes_timer.stop()
         self.update_approval_button.setEnabled(False)
         
-        # Emit signal
+        # Emit the change, then the full approval data
+        self.approvalDelta.emit({
+            'status': new_status,
+            'supervisor_notes': supervisor_notes,
+            'client_delivery': client_delivery,
+            'client_version': client_version,
+            'new_history_entry': history_entry
+        })
         self.approvalChanged.emit(self.current_approval_data)
     
+    @Slot()
     def reset_form(self):
         """Reset form to original approval data."""
         self.update_form_from_data()
         self.update_approval_button.setEnabled(False)
     
+    @Slot()
     def quick_approve(self):
         """Quick approve action."""
-        self.status_combo.setCurrentText("Approved")
-        self.supervisor_notes.setPlainText("Approved for delivery")
-        self.update_approval()
+        self._apply_quick_action('approved', "Approved for delivery")
     
+    @Slot()
     def quick_reject(self):
         """Quick reject action."""
-        self.status_combo.setCurrentText("Rejected")
-        self.supervisor_notes.setPlainText("Rejected - see notes for details")
-        self.update_approval()
+        self._apply_quick_action('rejected', "Rejected - see notes for details")
     
+    @Slot()
     def quick_needs_revision(self):
         """Quick needs revision action."""
-        self.status_combo.setCurrentText("Needs Revision")
-        self.supervisor_notes.setPlainText("Needs revision - see notes for details")
+        self._apply_quick_action('needs_revision', "Needs revision - see notes for details")
+    
+    def _apply_quick_action(self, status: str, notes: str):
+        """Set status and notes without triggering edit handlers, then update once."""
+        with _block_signals(self.status_combo, self.supervisor_notes):
+            self.status_combo.setCurrentIndex(self._STATUS_INDEX[status])
+            self.supervisor_notes.setPlainText(notes)
         self.update_approval()
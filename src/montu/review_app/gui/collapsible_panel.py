@@ -5,13 +5,10 @@ Reusable collapsible panel component with smooth hide/show toggle
 functionality and customizable content for the Review Application.
 """
 
-from typing import Optional, Dict
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFrame,
-    QSizePolicy, QGraphicsOpacityEffect
-)
-from PySide6.QtCore import Qt, Signal, QEasingCurve, QPropertyAnimation, QRect
-from PySide6.QtGui import QIcon, QPainter, QPixmap
+from functools import partial
+from typing import Callable, Optional, Dict, List
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFrame
+from PySide6.QtCore import Signal, Slot, QEvent, QEasingCurve, QPropertyAnimation
 
 
 class CollapsiblePanel(QWidget):
@@ -25,19 +22,24 @@ class CollapsiblePanel(QWidget):
     # Signals
     toggled = Signal(bool)  # expanded state
     
-    def __init__(self, title: str = "Panel", parent=None):
-        """Initialize collapsible panel."""
+    def __init__(self, title: str = "Panel", parent=None, collapsed: bool = False):
+        """Initialize collapsible panel, optionally starting collapsed without animation."""
         super().__init__(parent)
         
         # State
         self.title = title
         self.is_expanded = True
         self.content_widget: Optional[QWidget] = None
+        self._content_factory: Optional[Callable[[], QWidget]] = None  # builds content on first expand
         self.animation_duration = 300  # milliseconds
+        self._cached_content_height: Optional[int] = None  # reset on content layout changes
         
         # Setup UI
         self.setup_ui()
         self.setup_animations()
+        
+        if collapsed:
+            self._collapse_immediately()
     
     def setup_ui(self):
         """Set up the collapsible panel user interface."""
@@ -154,27 +156,51 @@ class CollapsiblePanel(QWidget):
         self.size_animation = QPropertyAnimation(self.content_container, b"maximumHeight")
         self.size_animation.setDuration(self.animation_duration)
         self.size_animation.setEasingCurve(QEasingCurve.InOutCubic)
-        
-        # Opacity animation
-        self.opacity_effect = QGraphicsOpacityEffect()
-        self.content_container.setGraphicsEffect(self.opacity_effect)
-        
-        self.opacity_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.opacity_animation.setDuration(self.animation_duration)
-        self.opacity_animation.setEasingCurve(QEasingCurve.InOutCubic)
+        self.size_animation.finished.connect(self.hide_content_after_collapse)
     
     def set_content_widget(self, widget: QWidget):
         """Set the content widget for the collapsible panel."""
         # Remove existing content
         if self.content_widget:
+            self.content_widget.removeEventFilter(self)
             self.content_layout.removeWidget(self.content_widget)
             self.content_widget.setParent(None)
         
         # Add new content
         self.content_widget = widget
+        self._cached_content_height = None
         if widget:
             self.content_layout.addWidget(widget)
+            widget.installEventFilter(self)
+    
+    def set_content_factory(self, factory: Callable[[], QWidget]):
+        """Set a factory that builds the content widget the first time the panel expands."""
+        self._content_factory = factory
+        if self.is_expanded:
+            self._ensure_content()
+    
+    def _ensure_content(self):
+        """Build deferred content from the content factory, if one is pending."""
+        if self._content_factory is not None:
+            factory = self._content_factory
+            self._content_factory = None
+            self.set_content_widget(factory())
     
+    def _collapse_immediately(self):
+        """Collapse the panel without animation or signals."""
+        self.size_animation.stop()
+        self.is_expanded = False
+        self.content_container.setMaximumHeight(0)
+        self.content_container.hide()
+        self.update_toggle_button()
+    
+    def eventFilter(self, watched, event):
+        """Drop the cached content height when the content layout changes."""
+        if watched is self.content_widget and event.type() == QEvent.LayoutRequest:
+            self._cached_content_height = None
+        return super().eventFilter(watched, event)
+    
+    @Slot()
     def toggle(self):
         """Toggle the panel expanded/collapsed state."""
         self.set_expanded(not self.is_expanded)
@@ -196,46 +222,40 @@ class CollapsiblePanel(QWidget):
     
     def expand(self):
         """Expand the panel with smooth animation."""
+        self._ensure_content()
+        
         # Get the content height
         if self.content_widget:
-            content_height = self.content_widget.sizeHint().height() + 20  # Add padding
+            if self._cached_content_height is None:
+                self._cached_content_height = self.content_widget.sizeHint().height() + 20  # Add padding
+            content_height = self._cached_content_height
         else:
             content_height = 100  # Default height
         
-        # Animate size
-        self.size_animation.setStartValue(0)
+        # Animate size, continuing from the current height if a collapse is in progress
+        self.size_animation.stop()
+        start_height = self.content_container.height() if self.content_container.isVisible() else 0
+        self.size_animation.setStartValue(start_height)
         self.size_animation.setEndValue(content_height)
         self.size_animation.start()
         
-        # Animate opacity
-        self.opacity_animation.setStartValue(0.0)
-        self.opacity_animation.setEndValue(1.0)
-        self.opacity_animation.start()
-        
         # Show content
         self.content_container.show()
     
     def collapse(self):
         """Collapse the panel with smooth animation."""
-        # Animate size
+        # Animate size, replacing any expand still in progress
+        self.size_animation.stop()
         current_height = self.content_container.height()
         self.size_animation.setStartValue(current_height)
         self.size_animation.setEndValue(0)
         self.size_animation.start()
-        
-        # Animate opacity
-        self.opacity_animation.setStartValue(1.0)
-        self.opacity_animation.setEndValue(0.0)
-        self.opacity_animation.start()
-        
-        # Hide content after animation
-        self.size_animation.finished.connect(self.hide_content_after_collapse)
     
+    @Slot()
     def hide_content_after_collapse(self):
         """Hide content container after collapse animation."""
         if not self.is_expanded:
             self.content_container.hide()
-        self.size_animation.finished.disconnect()
     
     def update_toggle_button(self):
         """Update toggle button appearance based on state."""
@@ -265,7 +285,6 @@ class CollapsiblePanel(QWidget):
         """Set the animation duration in milliseconds."""
         self.animation_duration = duration
         self.size_animation.setDuration(duration)
-        self.opacity_animation.setDuration(duration)
 
 
 class CollapsiblePanelContainer(QWidget):
@@ -285,6 +304,7 @@ class CollapsiblePanelContainer(QWidget):
         
         # State
         self.panels: Dict[str, CollapsiblePanel] = {}
+        self._panels_ordered: List[CollapsiblePanel] = []
         
         # Setup UI
         self.layout = QVBoxLayout(self)
@@ -295,13 +315,32 @@ class CollapsiblePanelContainer(QWidget):
         """Add a collapsible panel to the container."""
         panel = CollapsiblePanel(title, self)
         panel.set_content_widget(content_widget)
-        panel.toggled.connect(lambda expanded: self.panelToggled.emit(name, expanded))
+        panel.toggled.connect(partial(self._on_panel_toggled, name))
+        
+        self.panels[name] = panel
+        self._panels_ordered.append(panel)
+        self.layout.addWidget(panel)
+        
+        return panel
+    
+    def add_panel_lazy(self, name: str, title: str,
+                       factory: Callable[[], QWidget]) -> CollapsiblePanel:
+        """Add a collapsed panel whose content is built by factory on first expand."""
+        panel = CollapsiblePanel(title, self, collapsed=True)
+        panel.set_content_factory(factory)
+        panel.toggled.connect(partial(self._on_panel_toggled, name))
         
         self.panels[name] = panel
+        self._panels_ordered.append(panel)
         self.layout.addWidget(panel)
         
         return panel
     
+    @Slot(str, bool)
+    def _on_panel_toggled(self, name: str, expanded: bool):
+        """Forward a panel's toggled signal with its name."""
+        self.panelToggled.emit(name, expanded)
+    
     def get_panel(self, name: str) -> Optional[CollapsiblePanel]:
         """Get a panel by name."""
         return self.panels.get(name)
@@ -326,10 +365,19 @@ class CollapsiblePanelContainer(QWidget):
     
     def expand_all(self):
         """Expand all panels."""
-        for panel in self.panels.values():
-            panel.set_expanded(True)
+        self._set_all_expanded(True)
     
     def collapse_all(self):
         """Collapse all panels."""
-        for panel in self.panels.values():
-            panel.set_expanded(False)
+        self._set_all_expanded(False)
+    
+    def _set_all_expanded(self, expanded: bool):
+        """Set every panel's expanded state with a single layout pass."""
+        self.setUpdatesEnabled(False)
+        try:
+            for panel in self._panels_ordered:
+                if panel.is_expanded != expanded:
+                    panel.set_expanded(expanded)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
@@ -5,14 +5,33 @@ Advanced filtering controls for the Review Application providing
 Episode, Sequence, Shot, Artist, Status, and File Type filtering.
 """
 
-from typing import Dict, List, Any, Optional, Set
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, 
     QComboBox, QPushButton, QCheckBox, QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker
 from PySide6.QtGui import QFont
 
+from ..utils.media_prep import parse_task_id
+
+
+@dataclass(frozen=True, slots=True)
+class FilterCriteria:
+    """Active filter selections; None means the field is not filtered."""
+    
+    episode: Optional[str] = None
+    sequence: Optional[str] = None
+    shot: Optional[str] = None
+    artist: Optional[str] = None
+    status: Optional[str] = None
+    file_type: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Return the active filters as a filter_key -> value dict."""
+        return {key: getattr(self, key) for key in self.__slots__ if getattr(self, key) is not None}
+
 
 class FilterWidget(QWidget):
     """
@@ -23,7 +42,7 @@ class FilterWidget(QWidget):
     """
     
     # Signals
-    filtersChanged = Signal(dict)  # filter_criteria
+    filtersChanged = Signal(object)  # FilterCriteria
     filtersCleared = Signal()      # all filters cleared
     
     def __init__(self, parent=None):
@@ -50,6 +69,18 @@ class FilterWidget(QWidget):
             'file_types': set()
         }
         
+        # Sorted options each combo was last filled with, by option key
+        self._last_populated: Dict[str, Tuple[str, ...]] = {}
+        
+        # Criteria last emitted through filtersChanged
+        self._last_criteria = FilterCriteria()
+        
+        # Coalesce bursts of combo changes into one filter apply
+        self.apply_timer = QTimer()
+        self.apply_timer.setSingleShot(True)
+        self.apply_timer.setInterval(150)
+        self.apply_timer.timeout.connect(self._auto_apply_filters)
+        
         # Setup UI
         self.setup_ui()
         self.setup_connections()
@@ -91,31 +122,41 @@ class FilterWidget(QWidget):
     def create_filter_controls(self, layout):
         """Create individual filter control sections."""
         # Episode filter
-        self.episode_combo = self.create_filter_combo("Episode:", "All Episodes")
-        layout.addWidget(self.episode_combo)
+        self.episode_container, self.episode_combo = self.create_filter_combo("Episode:", "All Episodes")
+        layout.addWidget(self.episode_container)
         
         # Sequence filter
-        self.sequence_combo = self.create_filter_combo("Sequence:", "All Sequences")
-        layout.addWidget(self.sequence_combo)
+        self.sequence_container, self.sequence_combo = self.create_filter_combo("Sequence:", "All Sequences")
+        layout.addWidget(self.sequence_container)
         
         # Shot filter
-        self.shot_combo = self.create_filter_combo("Shot:", "All Shots")
-        layout.addWidget(self.shot_combo)
+        self.shot_container, self.shot_combo = self.create_filter_combo("Shot:", "All Shots")
+        layout.addWidget(self.shot_container)
         
         # Artist filter
-        self.artist_combo = self.create_filter_combo("Artist:", "All Artists")
-        layout.addWidget(self.artist_combo)
+        self.artist_container, self.artist_combo = self.create_filter_combo("Artist:", "All Artists")
+        layout.addWidget(self.artist_container)
         
         # Status filter
-        self.status_combo = self.create_filter_combo("Status:", "All Statuses")
-        layout.addWidget(self.status_combo)
+        self.status_container, self.status_combo = self.create_filter_combo("Status:", "All Statuses")
+        layout.addWidget(self.status_container)
         
         # File Type filter
-        self.file_type_combo = self.create_filter_combo("File Type:", "All Types")
-        layout.addWidget(self.file_type_combo)
+        self.file_type_container, self.file_type_combo = self.create_filter_combo("File Type:", "All Types")
+        layout.addWidget(self.file_type_container)
+        
+        # Filter key, combo, option key, and default text for each filter
+        self._filter_combos: List[Tuple[str, QComboBox, str, str]] = [
+            ('episode', self.episode_combo, 'episodes', 'All Episodes'),
+            ('sequence', self.sequence_combo, 'sequences', 'All Sequences'),
+            ('shot', self.shot_combo, 'shots', 'All Shots'),
+            ('artist', self.artist_combo, 'artists', 'All Artists'),
+            ('status', self.status_combo, 'statuses', 'All Statuses'),
+            ('file_type', self.file_type_combo, 'file_types', 'All Types')
+        ]
     
-    def create_filter_combo(self, label_text: str, default_text: str) -> QWidget:
-        """Create a filter combo box with label."""
+    def create_filter_combo(self, label_text: str, default_text: str) -> Tuple[QWidget, QComboBox]:
+        """Create a filter combo box with label, returning the container and the combo."""
         container = QWidget()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -152,7 +193,7 @@ class FilterWidget(QWidget):
         """)
         layout.addWidget(combo)
         
-        return container
+        return container, combo
     
     def create_action_buttons(self, layout):
         """Create action buttons for filter operations."""
@@ -203,12 +244,8 @@ class FilterWidget(QWidget):
     def setup_connections(self):
         """Set up signal connections."""
         # Combo box changes
-        self.episode_combo.findChild(QComboBox).currentTextChanged.connect(self.on_filter_changed)
-        self.sequence_combo.findChild(QComboBox).currentTextChanged.connect(self.on_filter_changed)
-        self.shot_combo.findChild(QComboBox).currentTextChanged.connect(self.on_filter_changed)
-        self.artist_combo.findChild(QComboBox).currentTextChanged.connect(self.on_filter_changed)
-        self.status_combo.findChild(QComboBox).currentTextChanged.connect(self.on_filter_changed)
-        self.file_type_combo.findChild(QComboBox).currentTextChanged.connect(self.on_filter_changed)
+        for _, combo, _, _ in self._filter_combos:
+            combo.currentTextChanged.connect(self.on_filter_changed)
         
         # Button clicks
         self.clear_button.clicked.connect(self.clear_all_filters)
@@ -216,102 +253,104 @@ class FilterWidget(QWidget):
     
     def populate_filter_options(self, media_items: List[Dict[str, Any]]):
         """Populate filter options from media data."""
-        # Clear existing options
-        for key in self.available_options:
-            self.available_options[key].clear()
+        # Option sets bound once for the loop
+        episodes = self.available_options['episodes']
+        sequences = self.available_options['sequences']
+        shots = self.available_options['shots']
+        artists = self.available_options['artists']
+        statuses = self.available_options['statuses']
+        file_types = self.available_options['file_types']
+        for options in self.available_options.values():
+            options.clear()
+        
+        # Display text per raw status, formatted once per distinct value
+        status_display: Dict[str, str] = {}
         
         # Extract unique values from media items
         for item in media_items:
-            task_id = item.get('task_id', '')
+            item_get = item.get
             
-            # Parse task_id for episode, sequence, shot
-            if task_id:
-                parts = task_id.split('_')
-                if len(parts) >= 3:
-                    episode = parts[0]  # ep00
-                    sequence = parts[1]  # sq010
-                    shot = parts[2]     # sh020
-                    
-                    self.available_options['episodes'].add(episode)
-                    self.available_options['sequences'].add(sequence)
-                    self.available_options['shots'].add(shot)
+            # Episode, sequence, shot from the parsed task_id
+            episode, sequence, shot = parse_task_id(item_get('task_id') or '')
+            if shot:
+                episodes.add(episode)
+                sequences.add(sequence)
+                shots.add(shot)
             
             # Extract other filter options
-            author = item.get('author', '')
+            author = item_get('author')
             if author:
-                self.available_options['artists'].add(author)
+                artists.add(author)
             
-            status = item.get('approval_status', '')
+            status = item_get('approval_status')
             if status:
-                self.available_options['statuses'].add(status.replace('_', ' ').title())
+                display = status_display.get(status)
+                if display is None:
+                    display = status_display[status] = status.replace('_', ' ').title()
+                statuses.add(display)
             
-            file_ext = item.get('file_extension', '')
+            file_ext = item_get('file_extension')
             if file_ext:
-                self.available_options['file_types'].add(file_ext)
+                file_types.add(file_ext)
         
         # Update combo boxes
         self.update_combo_options()
     
     def update_combo_options(self):
         """Update combo box options with available values."""
-        combos = [
-            (self.episode_combo.findChild(QComboBox), 'episodes', 'All Episodes'),
-            (self.sequence_combo.findChild(QComboBox), 'sequences', 'All Sequences'),
-            (self.shot_combo.findChild(QComboBox), 'shots', 'All Shots'),
-            (self.artist_combo.findChild(QComboBox), 'artists', 'All Artists'),
-            (self.status_combo.findChild(QComboBox), 'statuses', 'All Statuses'),
-            (self.file_type_combo.findChild(QComboBox), 'file_types', 'All Types')
-        ]
-        
-        for combo, option_key, default_text in combos:
-            # Clear existing items (except "All" option)
-            combo.clear()
-            combo.addItem(default_text, "all")
+        for _, combo, option_key, default_text in self._filter_combos:
+            # Skip combos whose options are unchanged
+            options = tuple(sorted(self.available_options[option_key]))
+            if options == self._last_populated.get(option_key):
+                continue
+            self._last_populated[option_key] = options
             
-            # Add sorted options
-            options = sorted(list(self.available_options[option_key]))
-            for option in options:
-                combo.addItem(option, option)
+            # Repopulating is not a user filter change
+            with QSignalBlocker(combo):
+                combo.setUpdatesEnabled(False)
+                try:
+                    # Clear existing items (except "All" option)
+                    combo.clear()
+                    combo.addItem(default_text, "all")
+                    
+                    # Add sorted options in one batch; item data mirrors the text
+                    combo.addItems(options)
+                    for row, option in enumerate(options, 1):
+                        combo.setItemData(row, option)
+                finally:
+                    combo.setUpdatesEnabled(True)
     
     def on_filter_changed(self):
         """Handle filter change events."""
-        # Auto-apply filters when changed (optional - can be disabled for manual apply only)
-        pass
+        # Auto-apply once the selection settles
+        self.apply_timer.start()
+    
+    def _auto_apply_filters(self):
+        """Apply the settled combo selections unless they were already applied."""
+        if self.get_active_criteria() != self._last_criteria:
+            self.apply_filters()
     
     def apply_filters(self):
         """Apply current filter selections."""
-        # Get current selections
-        filters = {
-            'episode': self.episode_combo.findChild(QComboBox).currentData(),
-            'sequence': self.sequence_combo.findChild(QComboBox).currentData(),
-            'shot': self.shot_combo.findChild(QComboBox).currentData(),
-            'artist': self.artist_combo.findChild(QComboBox).currentData(),
-            'status': self.status_combo.findChild(QComboBox).currentData(),
-            'file_type': self.file_type_combo.findChild(QComboBox).currentData()
-        }
-        
-        # Remove "all" selections
-        active_filters = {k: v for k, v in filters.items() if v != "all"}
+        # Get current selections; always emitted so Apply can force a re-query
+        self.apply_timer.stop()
+        criteria = self.get_active_criteria()
+        self._last_criteria = criteria
+        active_filters = criteria.to_dict()
         
         # Emit signal
-        self.filtersChanged.emit(active_filters)
+        self.filtersChanged.emit(criteria)
         
         print(f"Applied filters: {active_filters}")
     
     def clear_all_filters(self):
         """Clear all filter selections."""
         # Reset all combo boxes to "All" option
-        combos = [
-            self.episode_combo.findChild(QComboBox),
-            self.sequence_combo.findChild(QComboBox),
-            self.shot_combo.findChild(QComboBox),
-            self.artist_combo.findChild(QComboBox),
-            self.status_combo.findChild(QComboBox),
-            self.file_type_combo.findChild(QComboBox)
-        ]
-        
-        for combo in combos:
-            combo.setCurrentIndex(0)  # Select "All" option
+        self.apply_timer.stop()
+        for _, combo, _, _ in self._filter_combos:
+            with QSignalBlocker(combo):
+                combo.setCurrentIndex(0)  # Select "All" option
+        self._last_criteria = FilterCriteria()
         
         # Clear filter state
         for key in self.current_filters:
@@ -322,16 +361,12 @@ class FilterWidget(QWidget):
         
         print("All filters cleared")
     
-    def get_active_filters(self) -> Dict[str, Any]:
+    def get_active_criteria(self) -> FilterCriteria:
         """Get currently active filter criteria."""
-        filters = {
-            'episode': self.episode_combo.findChild(QComboBox).currentData(),
-            'sequence': self.sequence_combo.findChild(QComboBox).currentData(),
-            'shot': self.shot_combo.findChild(QComboBox).currentData(),
-            'artist': self.artist_combo.findChild(QComboBox).currentData(),
-            'status': self.status_combo.findChild(QComboBox).currentData(),
-            'file_type': self.file_type_combo.findChild(QComboBox).currentData()
-        }
-        
-        # Remove "all" selections
-        return {k: v for k, v in filters.items() if v != "all"}
+        # _filter_combos is in FilterCriteria field order
+        values = [combo.currentData() for _, combo, _, _ in self._filter_combos]
+        return FilterCriteria(*(None if value == "all" else value for value in values))  # Skip "all" selections
+    
+    def get_active_filters(self) -> Dict[str, Any]:
+        """Get currently active filter criteria as a dict."""
+        return self.get_active_criteria().to_dict()
@@ -5,14 +5,193 @@ Advanced media list widget with sequence-based grouping, sorting,
 and collapsible group headers for the Review Application.
 """
 
+from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
-    QLabel, QPushButton, QFrame, QHeaderView, QAbstractItemView
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+    QLabel, QPushButton, QFrame, QHeaderView, QAbstractItemView,
+    QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QIcon, QPixmap, QPainter
+from PySide6.QtCore import Qt, Signal, QModelIndex, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QColor
+
+from ..core.models.grouped_media_model import GroupedMediaModel, MediaRow
+from ..utils.media_prep import parse_task_id
+
+
+# File extensions shown with the image icon
+_IMAGE_EXTS = frozenset({'.exr', '.jpg', '.jpeg', '.png', '.tiff'})
+
+# Type icon by file extension for non-video media
+_EXT_ICONS = dict.fromkeys(_IMAGE_EXTS, "🖼️")
+
+# Summary emoji by approval status
+_STATUS_EMOJI = {'pending': '⏳', 'under_review': '👁️', 'approved': '✅', 'rejected': '❌'}
+
+# Media row colors painted by MediaRowDelegate (mirror the tree view stylesheet)
+_SELECTED_BG = QColor('#4CAF50')
+_SELECTED_FG = QColor(Qt.white)
+_HOVER_BG = QColor('#e8f5e8')
+_ROW_BORDER = QColor('#eee')
+_TEXT_PADDING = 4
+
+
+def _recency_key(row: MediaRow):
+    """Sort key for media rows: Latest Date → Version (sort with reverse=True)."""
+    return row.sort_key
+
+
+def _date_sort_key(created_date: str) -> str:
+    """
+    Return a string that sorts chronologically for an ISO created_date.
+    
+    Dates already in datetime.isoformat() form with microseconds (as stored in
+    media records) are used as-is; anything else is parsed once and normalized
+    to that form in local time. Unparseable dates sort oldest.
+    """
+    if len(created_date) == 26 and created_date[10] == 'T' and created_date[19] == '.':
+        return created_date
+    try:
+        date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
+        if date_obj.tzinfo is not None:
+            date_obj = datetime.fromtimestamp(date_obj.timestamp())
+        return date_obj.isoformat(timespec='microseconds')
+    except (ValueError, TypeError, AttributeError):
+        return ''
+
+
+@lru_cache(maxsize=4096)
+def _elide(name: str) -> str:
+    """Truncate long file names for display."""
+    return name if len(name) <= 50 else name[:47] + "..."
+
+
+def _extract_sequence(task_id: str) -> str:
+    """Extract sequence identifier (sq010, sq020, etc.) from task_id."""
+    return parse_task_id(task_id or '')[1] or "unknown"
+
+
+def _prepare_items(media_items: List[Dict[str, Any]]) -> List[MediaRow]:
+    """
+    Derive sort keys and display fields for media items in a single pass.
+    
+    Returns one MediaRow per item, so grouping, sorting and rendering never
+    re-parse them. The media items themselves are not modified.
+    """
+    format_status = GroupedMediaModel.format_status_display
+    rows = []
+    for item in media_items:
+        # Version number (v003 -> 3)
+        version = item.get('version', 'v001')
+        version_num = 0
+        try:
+            if version.startswith('v'):
+                version_num = int(version[1:])
+        except (ValueError, TypeError, AttributeError):
+            version_num = 0
+        
+        # Type icon
+        if item.get('media_type', 'unknown') == 'video':
+            icon = "🎬"
+        else:
+            icon = _EXT_ICONS.get(item.get('file_extension', ''), "📄")
+        
+        rows.append(MediaRow(
+            item=item,
+            sort_key=(_date_sort_key(item.get('created_date') or ''), version_num),
+            sequence=_extract_sequence(item.get('task_id')),
+            icon=icon,
+            status_display=format_status(item.get('approval_status', 'pending')),
+            display_name=_elide(item.get('file_name', 'Unknown'))
+        ))
+    return rows
+
+
+def _group_by_sequence(rows: List[MediaRow]) -> Dict[str, List[MediaRow]]:
+    """Group media rows by sequence, each group sorted by recency."""
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.sequence].append(row)
+    
+    # Sort items within each group
+    for items in grouped.values():
+        items.sort(key=_recency_key, reverse=True)
+    
+    return dict(grouped)
+
+
+def prepare_grouped_media(media_items: List[Dict[str, Any]]) -> Dict[str, List[MediaRow]]:
+    """
+    Prepare media rows for display and group them by sequence.
+    
+    Pure Python and leaves the media items unmodified, so it can run on a
+    worker thread; pass the result to GroupedMediaWidget.set_prepared_media_items.
+    """
+    return _group_by_sequence(_prepare_items(media_items))
+
+
+class _PrepareTaskSignals(QObject):
+    """Signals emitted by _PrepareTask (QRunnable is not a QObject)."""
+    
+    prepared = Signal(object, object)  # media_items, grouped_data
+
+
+class _PrepareTask(QRunnable):
+    """Prepare and group media items on a pool thread."""
+    
+    def __init__(self, media_items: List[Dict[str, Any]]):
+        super().__init__()
+        self.media_items = media_items
+        self.signals = _PrepareTaskSignals()
+    
+    def run(self):
+        """Prepare and group the media items, then emit prepared."""
+        self.signals.prepared.emit(self.media_items, prepare_grouped_media(self.media_items))
+
+
+class MediaRowDelegate(QStyledItemDelegate):
+    """
+    Paint media rows directly from the prepared media item.
+    
+    Group headers keep the default delegate painting.
+    """
+    
+    def paint(self, painter, option, index):
+        """Paint the status background and elided cell text for a media row."""
+        media_item = index.data(Qt.UserRole)
+        if media_item is None:
+            super().paint(painter, option, index)
+            return
+        
+        rect = option.rect
+        state = option.state
+        painter.save()
+        
+        # Background: selection, then hover, then approval status
+        if state & QStyle.State_Selected:
+            painter.fillRect(rect, _SELECTED_BG)
+            painter.setPen(_SELECTED_FG)
+        else:
+            if state & QStyle.State_MouseOver:
+                background = _HOVER_BG
+            else:
+                background = GroupedMediaModel.STATUS_COLORS.get(media_item.get('approval_status', 'pending'))
+            if background is not None:
+                painter.fillRect(rect, background)
+            painter.setPen(option.palette.text().color())
+        
+        # Cell text, elided to the column width
+        text_rect = rect.adjusted(_TEXT_PADDING, 0, -_TEXT_PADDING, 0)
+        text = option.fontMetrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, text)
+        
+        # Row separator
+        painter.setPen(_ROW_BORDER)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        
+        painter.restore()
 
 
 class GroupedMediaWidget(QWidget):
@@ -33,8 +212,9 @@ class GroupedMediaWidget(QWidget):
         
         # State
         self.media_items: List[Dict[str, Any]] = []
-        self.grouped_data: Dict[str, List[Dict[str, Any]]] = {}
+        self.grouped_data: Dict[str, List[MediaRow]] = {}
         self.current_selection: Optional[Dict[str, Any]] = None
+        self._prepare_task: Optional[_PrepareTask] = None
         
         # Setup UI
         self.setup_ui()
@@ -46,39 +226,42 @@ class GroupedMediaWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
-        # Create tree widget for hierarchical display
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabels(["Media Files", "Version", "Status", "Author"])
+        # Create tree view for hierarchical display; rows are fetched from the model lazily
+        self.media_model = GroupedMediaModel()
+        self.tree_widget = QTreeView()
+        self.tree_widget.setModel(self.media_model)
         self.tree_widget.setRootIsDecorated(True)
         self.tree_widget.setAlternatingRowColors(True)
         self.tree_widget.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.tree_widget.setUniformRowHeights(False)
+        self.tree_widget.setUniformRowHeights(True)
+        self.row_delegate = MediaRowDelegate(self.tree_widget)
+        self.tree_widget.setItemDelegate(self.row_delegate)
         
         # Configure tree widget appearance
         self.tree_widget.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: #fafafa;
                 border: 1px solid #ddd;
                 font-size: 12px;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 padding: 4px;
                 border-bottom: 1px solid #eee;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: #4CAF50;
                 color: white;
             }
-            QTreeWidget::item:hover {
+            QTreeView::item:hover {
                 background-color: #e8f5e8;
             }
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {
+            QTreeView::branch:has-children:!has-siblings:closed,
+            QTreeView::branch:closed:has-children:has-siblings {
                 border-image: none;
                 image: url(none);
             }
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {
+            QTreeView::branch:open:has-children:!has-siblings,
+            QTreeView::branch:open:has-children:has-siblings {
                 border-image: none;
                 image: url(none);
             }
@@ -109,180 +292,67 @@ class GroupedMediaWidget(QWidget):
     
     def setup_connections(self):
         """Set up signal connections."""
-        self.tree_widget.itemSelectionChanged.connect(self.on_selection_changed)
-        self.tree_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.tree_widget.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.tree_widget.doubleClicked.connect(self.on_item_double_clicked)
     
     def set_media_items(self, media_items: List[Dict[str, Any]]):
-        """Set media items and update the grouped display."""
+        """Set media items; they are grouped off the UI thread and shown in on_media_prepared."""
+        self.media_items = media_items
+        self.summary_label.setText(f"Loading {len(media_items)} media files...")
+        
+        task = _PrepareTask(media_items)
+        task.signals.prepared.connect(self.on_media_prepared)
+        self._prepare_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    def set_prepared_media_items(self, media_items: List[Dict[str, Any]],
+                                 grouped_data: Dict[str, List[MediaRow]]):
+        """Set media items already grouped by prepare_grouped_media."""
         self.media_items = media_items
-        self.group_media_by_sequence()
+        self.on_media_prepared(media_items, grouped_data)
+    
+    def on_media_prepared(self, media_items: List[Dict[str, Any]],
+                          grouped_data: Dict[str, List[MediaRow]]):
+        """Show grouped media if the items are still the current ones."""
+        if media_items is not self.media_items:
+            return  # Items replaced while preparing
+        
+        self.grouped_data = grouped_data
         self.populate_tree_widget()
         self.update_summary()
     
     def group_media_by_sequence(self):
         """Group media items by sequence."""
-        self.grouped_data.clear()
-        
-        for item in self.media_items:
-            # Extract sequence from task_id
-            task_id = item.get('task_id', '')
-            sequence = self.extract_sequence_from_task_id(task_id)
-            
-            if sequence not in self.grouped_data:
-                self.grouped_data[sequence] = []
-            
-            self.grouped_data[sequence].append(item)
-        
-        # Sort items within each group
-        for sequence in self.grouped_data:
-            self.grouped_data[sequence] = self.sort_media_items(self.grouped_data[sequence])
+        self.grouped_data = prepare_grouped_media(self.media_items)
     
     def extract_sequence_from_task_id(self, task_id: str) -> str:
         """Extract sequence identifier from task_id."""
-        if not task_id:
-            return "unknown"
-        
-        parts = task_id.split('_')
-        if len(parts) >= 2:
-            return parts[1]  # sq010, sq020, etc.
-        
-        return "unknown"
+        return _extract_sequence(task_id)
     
     def sort_media_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Sort media items by Latest Date → Version."""
-        def sort_key(item):
-            # Primary sort: Latest date (most recent first)
-            created_date = item.get('created_date', '')
-            try:
-                date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                date_timestamp = date_obj.timestamp()
-            except:
-                date_timestamp = 0
-            
-            # Secondary sort: Version (v003, v002, v001)
-            version = item.get('version', 'v001')
-            version_num = 0
-            try:
-                if version.startswith('v'):
-                    version_num = int(version[1:])
-            except:
-                version_num = 0
-            
-            # Return tuple for sorting (negative date for descending, negative version for descending)
-            return (-date_timestamp, -version_num)
-        
-        return sorted(items, key=sort_key)
+        """Sort media items by Latest Date → Version (most recent first)."""
+        return [row.item for row in sorted(_prepare_items(items), key=_recency_key, reverse=True)]
     
     def populate_tree_widget(self):
-        """Populate the tree widget with grouped media data."""
-        self.tree_widget.clear()
-        
+        """Populate the tree view with grouped media data."""
         # Sort sequences for consistent display
-        sorted_sequences = sorted(self.grouped_data.keys())
+        groups = [
+            (sequence, self.grouped_data[sequence])
+            for sequence in sorted(self.grouped_data.keys())
+            if self.grouped_data[sequence]
+        ]
         
-        for sequence in sorted_sequences:
-            items = self.grouped_data[sequence]
-            if not items:
-                continue
-            
-            # Create sequence group header
-            group_item = QTreeWidgetItem(self.tree_widget)
-            group_item.setText(0, f"📁 {sequence.upper()} - Sequence {sequence[2:]} ({len(items)} files)")
-            group_item.setText(1, "")
-            group_item.setText(2, "")
-            group_item.setText(3, "")
-            
-            # Style group header
-            font = QFont()
-            font.setBold(True)
-            font.setPointSize(11)
-            group_item.setFont(0, font)
-            group_item.setBackground(0, Qt.lightGray)
-            group_item.setBackground(1, Qt.lightGray)
-            group_item.setBackground(2, Qt.lightGray)
-            group_item.setBackground(3, Qt.lightGray)
-            
-            # Set group item as non-selectable
-            group_item.setFlags(group_item.flags() & ~Qt.ItemIsSelectable)
-            
-            # Add media items to group
-            for media_item in items:
-                self.add_media_item_to_group(group_item, media_item)
+        # One model reset for all groups; repaint once after expanding.
+        # A reset does not emit selectionChanged, so drop the old selection here
+        self.current_selection = None
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            self.media_model.set_groups(groups)
             
-            # Expand group by default
-            group_item.setExpanded(True)
-    
-    def add_media_item_to_group(self, group_item: QTreeWidgetItem, media_item: Dict[str, Any]):
-        """Add a media item to a sequence group."""
-        item = QTreeWidgetItem(group_item)
-        
-        # Format media file name with icon
-        file_name = media_item.get('file_name', 'Unknown')
-        media_type = media_item.get('media_type', 'unknown')
-        file_extension = media_item.get('file_extension', '')
-        
-        # Add type icon
-        if media_type == 'video':
-            icon = "🎬"
-        elif file_extension in ['.exr', '.jpg', '.jpeg', '.png', '.tiff']:
-            icon = "🖼️"
-        else:
-            icon = "📄"
-        
-        # Truncate long file names
-        display_name = file_name
-        if len(display_name) > 50:
-            display_name = display_name[:47] + "..."
-        
-        item.setText(0, f"{icon} {display_name}")
-        
-        # Version
-        version = media_item.get('version', 'v001')
-        item.setText(1, version)
-        
-        # Status with emoji
-        status = media_item.get('approval_status', 'pending')
-        status_display = self.format_status_display(status)
-        item.setText(2, status_display)
-        
-        # Author
-        author = media_item.get('author', 'Unknown')
-        item.setText(3, author)
-        
-        # Store media item data
-        item.setData(0, Qt.UserRole, media_item)
-        
-        # Style based on status
-        self.style_item_by_status(item, status)
-    
-    def format_status_display(self, status: str) -> str:
-        """Format status with appropriate emoji."""
-        status_map = {
-            'pending': '⏳ Pending',
-            'under_review': '👁️ Under Review',
-            'approved': '✅ Approved',
-            'rejected': '❌ Rejected',
-            'archived': '📦 Archived'
-        }
-        return status_map.get(status, f"❓ {status.title()}")
-    
-    def style_item_by_status(self, item: QTreeWidgetItem, status: str):
-        """Apply styling based on approval status."""
-        if status == 'approved':
-            item.setBackground(0, Qt.green.lighter(180))
-            item.setBackground(1, Qt.green.lighter(180))
-            item.setBackground(2, Qt.green.lighter(180))
-            item.setBackground(3, Qt.green.lighter(180))
-        elif status == 'rejected':
-            item.setBackground(0, Qt.red.lighter(180))
-            item.setBackground(1, Qt.red.lighter(180))
-            item.setBackground(2, Qt.red.lighter(180))
-            item.setBackground(3, Qt.red.lighter(180))
-        elif status == 'under_review':
-            item.setBackground(0, Qt.yellow.lighter(180))
-            item.setBackground(1, Qt.yellow.lighter(180))
-            item.setBackground(2, Qt.yellow.lighter(180))
-            item.setBackground(3, Qt.yellow.lighter(180))
+            # Expand groups by default
+            self.tree_widget.expandAll()
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
     
     def update_summary(self):
         """Update the summary label with media statistics."""
@@ -294,40 +364,30 @@ class GroupedMediaWidget(QWidget):
         total_sequences = len(self.grouped_data)
         
         # Count by status
-        status_counts = {}
-        for item in self.media_items:
-            status = item.get('approval_status', 'pending')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Format summary
-        summary_parts = [f"{total_files} files in {total_sequences} sequences"]
-        
-        if status_counts:
-            status_summary = []
-            for status, count in status_counts.items():
-                emoji = {'pending': '⏳', 'under_review': '👁️', 'approved': '✅', 'rejected': '❌'}.get(status, '❓')
-                status_summary.append(f"{emoji}{count}")
-            summary_parts.append(" | ".join(status_summary))
+        status_counts = Counter(item.get('approval_status', 'pending') for item in self.media_items)
         
-        self.summary_label.setText(" | ".join(summary_parts))
+        # Format summary; media_items is non-empty, so there is at least one status
+        status_summary = " | ".join(
+            f"{_STATUS_EMOJI.get(status, '❓')}{count}" for status, count in status_counts.items()
+        )
+        self.summary_label.setText(f"{total_files} files in {total_sequences} sequences | {status_summary}")
     
     def on_selection_changed(self):
-        """Handle selection changes in the tree widget."""
-        selected_items = self.tree_widget.selectedItems()
-        if not selected_items:
+        """Handle selection changes in the tree view."""
+        selected_indexes = self.tree_widget.selectionModel().selectedRows()
+        if not selected_indexes:
             self.current_selection = None
             return
         
-        item = selected_items[0]
-        media_item = item.data(0, Qt.UserRole)
+        media_item = self.media_model.media_item(selected_indexes[0])
         
         if media_item:  # Only emit for media items, not group headers
             self.current_selection = media_item
             self.mediaSelected.emit(media_item)
     
-    def on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_item_double_clicked(self, index: QModelIndex):
         """Handle double-click events."""
-        media_item = item.data(0, Qt.UserRole)
+        media_item = self.media_model.media_item(index)
         if media_item:
             self.mediaDoubleClicked.emit(media_item)
     
@@ -337,8 +397,8 @@ class GroupedMediaWidget(QWidget):
     
     def clear(self):
         """Clear all media items and reset the widget."""
-        self.media_items.clear()
+        self.media_items = []  # New list, so a pending prepare result is dropped
         self.grouped_data.clear()
         self.current_selection = None
-        self.tree_widget.clear()
+        self.media_model.clear()
         self.summary_label.setText("No media files loaded")
@@ -14,7 +14,7 @@ from PySide6.QtWidgets import (
     QMenuBar, QStatusBar, QProgressBar, QMessageBox, QGroupBox,
     QLabel, QComboBox, QPushButton, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QIcon, QFont
 
 # Add src to path for imports
@@ -23,10 +23,61 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from .media_player_widget import MediaPlayerWidget
 from .annotation_widget import AnnotationWidget
 from .approval_widget import ApprovalWidget
-from .filter_widget import FilterWidget
-from .grouped_media_widget import GroupedMediaWidget
+from .filter_widget import FilterWidget, FilterCriteria
+from .grouped_media_widget import GroupedMediaWidget, prepare_grouped_media
 from .collapsible_panel import CollapsiblePanelContainer
 from ..core.models.review_model import ReviewModel
+from ..core.models.grouped_media_model import MediaRow
+
+
+class _LoadMediaTaskSignals(QObject):
+    """Signals emitted by _LoadMediaTask (QRunnable is not a QObject)."""
+    
+    loaded = Signal(int, object, object, str)  # request_id, media_items, grouped_data, error message ("" on success)
+
+
+class _LoadMediaTask(QRunnable):
+    """Query a project's media and prepare it for display on a pool thread."""
+    
+    def __init__(self, request_id: int, review_model: ReviewModel,
+                 project_id: str, filters: Dict[str, Any]):
+        super().__init__()
+        self.request_id = request_id
+        self.review_model = review_model
+        self.project_id = project_id
+        self.filters = filters
+        self.signals = _LoadMediaTaskSignals()
+    
+    def run(self):
+        """Load and group the media items, then emit loaded."""
+        try:
+            media_items = self.review_model.get_media_for_project(self.project_id, self.filters)
+            grouped_data = prepare_grouped_media(media_items)
+            self.signals.loaded.emit(self.request_id, media_items, grouped_data, "")
+        except Exception as e:
+            self.signals.loaded.emit(self.request_id, [], {}, str(e))
+
+
+class _LoadProjectsTaskSignals(QObject):
+    """Signals emitted by _LoadProjectsTask (QRunnable is not a QObject)."""
+    
+    loaded = Signal(object, str)  # projects, error message ("" on success)
+
+
+class _LoadProjectsTask(QRunnable):
+    """Query available projects on a pool thread."""
+    
+    def __init__(self, review_model: ReviewModel):
+        super().__init__()
+        self.review_model = review_model
+        self.signals = _LoadProjectsTaskSignals()
+    
+    def run(self):
+        """Load the projects, then emit loaded."""
+        try:
+            self.signals.loaded.emit(self.review_model.get_available_projects(), "")
+        except Exception as e:
+            self.signals.loaded.emit([], str(e))
 
 
 class ReviewAppMainWindow(QMainWindow):
@@ -49,19 +100,32 @@ class ReviewAppMainWindow(QMainWindow):
         self.current_media_item: Optional[Dict[str, Any]] = None
         self.current_filters: Dict[str, Any] = {}
         
+        # Media loading; only the latest request's results are shown
+        self._media_request = 0
+        self._load_media_task: Optional[_LoadMediaTask] = None
+        self._load_projects_task: Optional[_LoadProjectsTask] = None
+        
         # Setup UI
         self.setup_ui()
         self.setup_menu_bar()
         self.setup_status_bar()
         self.setup_connections()
         
-        # Load initial data
-        self.load_available_projects()
-        
-        # Setup auto-refresh timer
+        # Setup auto-refresh timer; runs only while a project is selected and the window is shown
         self.refresh_timer = QTimer()
+        self.refresh_timer.setTimerType(Qt.CoarseTimer)
+        self.refresh_timer.setInterval(30000)  # Refresh every 30 seconds
         self.refresh_timer.timeout.connect(self.refresh_media_list)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        
+        # Coalesce bursts of filter changes into one media refresh
+        self.filter_refresh_timer = QTimer()
+        self.filter_refresh_timer.setSingleShot(True)
+        self.filter_refresh_timer.setTimerType(Qt.CoarseTimer)
+        self.filter_refresh_timer.setInterval(150)
+        self.filter_refresh_timer.timeout.connect(self.refresh_media_list)
+        
+        # Load initial data
+        self.load_available_projects()
     
     def setup_ui(self):
         """Set up the main user interface."""
@@ -128,12 +192,12 @@ class ReviewAppMainWindow(QMainWindow):
             self.annotation_widget
         )
 
-        # Create approval widget
-        self.approval_widget = ApprovalWidget()
-        self.approval_panel = self.collapsible_container.add_panel(
+        # Approval widget is built the first time its panel is expanded
+        self.approval_widget: Optional[ApprovalWidget] = None
+        self.approval_panel = self.collapsible_container.add_panel_lazy(
             "approval",
             "Approval Workflow",
-            self.approval_widget
+            self.create_approval_widget
         )
 
         # Store reference to right panel for layout adjustments
@@ -247,9 +311,6 @@ class ReviewAppMainWindow(QMainWindow):
         # Annotation connections
         self.annotation_widget.annotationAdded.connect(self.on_annotation_added)
         
-        # Approval connections
-        self.approval_widget.approvalChanged.connect(self.on_approval_changed)
-
         # Filter connections
         self.filter_widget.filtersChanged.connect(self.on_filters_changed)
         self.filter_widget.filtersCleared.connect(self.on_filters_cleared)
@@ -258,17 +319,40 @@ class ReviewAppMainWindow(QMainWindow):
         self.collapsible_container.panelToggled.connect(self.on_panel_toggled)
     
     def load_available_projects(self):
-        """Load available projects from database."""
+        """Load available projects off the UI thread; results arrive in on_projects_loaded."""
+        self.status_bar.showMessage("Loading projects...")
+        
+        task = _LoadProjectsTask(self.review_model)
+        task.signals.loaded.connect(self.on_projects_loaded, Qt.QueuedConnection)
+        self._load_projects_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    @Slot(object, str)
+    def on_projects_loaded(self, projects: List[Dict[str, Any]], error: str):
+        """Fill the project selector with loaded projects."""
+        if error:
+            self.show_error("Error Loading Projects", error)
+            return
+        
         try:
-            projects = self.review_model.get_available_projects()
-            
-            self.project_selector.clear()
-            self.project_selector.addItem("Select Project...", "")
+            project_ids = [project.get('_id', 'Unknown') for project in projects]
+            project_texts = [
+                f"{project.get('name', project_id)} ({project_id})"
+                for project, project_id in zip(projects, project_ids)
+            ]
             
-            for project in projects:
-                project_id = project.get('_id', 'Unknown')
-                project_name = project.get('name', project_id)
-                self.project_selector.addItem(f"{project_name} ({project_id})", project_id)
+            # Refill in one batch; resetting to the placeholder is not a project change
+            selector = self.project_selector
+            with QSignalBlocker(selector):
+                selector.setUpdatesEnabled(False)
+                try:
+                    selector.clear()
+                    selector.addItem("Select Project...", "")
+                    selector.addItems(project_texts)
+                    for row, project_id in enumerate(project_ids, 1):
+                        selector.setItemData(row, project_id)
+                finally:
+                    selector.setUpdatesEnabled(True)
             
             if projects:
                 self.status_bar.showMessage(f"Loaded {len(projects)} projects")
@@ -278,6 +362,7 @@ class ReviewAppMainWindow(QMainWindow):
         except Exception as e:
             self.show_error("Error Loading Projects", str(e))
     
+    @Slot(str)
     def on_project_changed(self, project_text: str):
         """Handle project selection change."""
         project_id = self.project_selector.currentData()
@@ -286,27 +371,59 @@ class ReviewAppMainWindow(QMainWindow):
             self.current_project_id = project_id
             self.review_model.set_current_project(project_id)
             self.refresh_media_list()
+            if self.isVisible():
+                self.refresh_timer.start()
             self.status_bar.showMessage(f"Selected project: {project_text}")
     
+    @Slot()
     def refresh_media_list(self):
         """Refresh the media list for current project."""
+        self.filter_refresh_timer.stop()  # This refresh covers any pending filter refresh
+        
         if not self.current_project_id:
+            self._media_request += 1  # Drop any pending load
+            self.refresh_timer.stop()
+            self.hide_progress()
             self.grouped_media_widget.clear()
             return
 
-        try:
-            self.show_progress("Loading media files...")
+        self.show_progress("Loading media files...")
 
-            # Get media items with current filters
-            media_items = self.review_model.get_media_for_project(self.current_project_id, self.current_filters)
+        # Query media off the UI thread; results arrive in on_media_list_loaded
+        self._media_request += 1
+        task = _LoadMediaTask(
+            self._media_request, self.review_model,
+            self.current_project_id, self.current_filters
+        )
+        task.signals.loaded.connect(self.on_media_list_loaded, Qt.QueuedConnection)
+        self._load_media_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    @Slot(int, object, object, str)
+    def on_media_list_loaded(self, request_id: int, media_items: List[Dict[str, Any]],
+                             grouped_data: Dict[str, List[MediaRow]], error: str):
+        """Show loaded media if it answers the latest refresh."""
+        if request_id != self._media_request:
+            return  # A newer refresh is pending
+
+        self.hide_progress()
+        if error:
+            self.show_error("Error Loading Media", error)
+            return
 
+        try:
             # Update filter options with all available media (without filters)
             if not self.current_filters:  # Only update when no filters are active
-                all_media_items = self.review_model.get_media_for_project(self.current_project_id)
-                self.filter_widget.populate_filter_options(all_media_items)
+                # Unfiltered items are all media; share them so task ids are parsed once
+                self.filter_widget.populate_filter_options(media_items)
 
-            # Set media items in grouped widget
-            self.grouped_media_widget.set_media_items(media_items)
+            # Set media items in grouped widget, already prepared by the load task;
+            # the tree and summary repaint once after the swap
+            self.grouped_media_widget.setUpdatesEnabled(False)
+            try:
+                self.grouped_media_widget.set_prepared_media_items(media_items, grouped_data)
+            finally:
+                self.grouped_media_widget.setUpdatesEnabled(True)
 
             # Update status bar with filter info
             if self.current_filters:
@@ -318,65 +435,24 @@ class ReviewAppMainWindow(QMainWindow):
 
         except Exception as e:
             self.show_error("Error Loading Media", str(e))
-        finally:
-            self.hide_progress()
     
-    def format_media_item_text(self, media_item: Dict[str, Any]) -> str:
-        """Format media item for display in list."""
-        task_id = media_item.get('task_id', 'Unknown')
-        version = media_item.get('version', 'v001')
-        file_type = media_item.get('file_type', 'unknown')
-        approval_status = media_item.get('approval_status', 'pending')
-        author = media_item.get('author', 'Unknown')
-        file_name = media_item.get('file_name', '')
-        file_extension = media_item.get('file_extension', '')
-
-        # Get task info if available
-        task_info = media_item.get('task_info', {})
-        shot = task_info.get('shot', 'Unknown')
-        task = task_info.get('task', 'Unknown')
-
-        # Create display name
-        if shot != 'Unknown' and task != 'Unknown':
-            display_name = f"{shot} - {task} ({version})"
-        else:
-            # Fallback to parsing task_id
-            parts = task_id.split('_')
-            if len(parts) >= 4:
-                shot = parts[2]
-                task = parts[3]
-                display_name = f"{shot} - {task} ({version})"
-            else:
-                display_name = f"{task_id} ({version})"
-
-        # Status emoji
-        status_emoji = {
-            'pending': '⏳',
-            'under_review': '👁️',
-            'approved': '✅',
-            'rejected': '❌',
-            'archived': '📦'
-        }.get(approval_status, '❓')
-
-        # File type emoji
-        type_emoji = {
-            'video': '🎬',
-            'image': '🖼️'
-        }.get(file_type, '📄')
-
-        # Format: [emoji] Shot-Task (version) [ext] - Author - Status
-        if file_extension:
-            return f"{type_emoji} {display_name} [{file_extension}] - {author} - {status_emoji} {approval_status}"
-        else:
-            return f"{type_emoji} {display_name} [{file_type}] - {author} - {status_emoji} {approval_status}"
+    def create_approval_widget(self) -> ApprovalWidget:
+        """Build the approval widget when its panel first expands."""
+        self.approval_widget = ApprovalWidget()
+        self.approval_widget.approvalDelta.connect(self.on_approval_changed)
+        if self.current_media_item:
+            self.approval_widget.set_media_item(self.current_media_item)
+        return self.approval_widget
     
+    @Slot(dict)
     def on_media_selected(self, media_item: Dict[str, Any]):
         """Handle media selection changes from grouped widget."""
         if not media_item:
             self.current_media_item = None
             self.media_player.clear_media()
             self.annotation_widget.clear_annotations()
-            self.approval_widget.clear_approval_data()
+            if self.approval_widget is not None:
+                self.approval_widget.clear_approval_data()
             return
 
         self.current_media_item = media_item
@@ -397,14 +473,16 @@ class ReviewAppMainWindow(QMainWindow):
         # Update annotation widget
         self.annotation_widget.set_media_item(media_item)
 
-        # Update approval widget
-        self.approval_widget.set_media_item(media_item)
+        # Update approval widget, if its panel has been opened
+        if self.approval_widget is not None:
+            self.approval_widget.set_media_item(media_item)
 
         # Update info display
         task_id = media_item.get('task_id', 'Unknown')
         version = media_item.get('version', 'v001')
         self.status_bar.showMessage(f"Selected: {task_id} {version}")
 
+    @Slot(dict)
     def on_media_double_clicked(self, media_item: Dict[str, Any]):
         """Handle media double-click events."""
         # Double-click could trigger OpenRV launch or full-screen playback
@@ -412,21 +490,29 @@ class ReviewAppMainWindow(QMainWindow):
             self.media_player.launch_in_openrv()
         print(f"Double-clicked media: {media_item.get('file_name', 'Unknown')}")
     
+    @Slot(str)
     def on_media_loaded(self, file_path: str):
         """Handle media loaded in player."""
         self.status_bar.showMessage(f"Loaded: {os.path.basename(file_path)}")
     
+    @Slot(str)
     def on_playback_state_changed(self, state: str):
         """Handle playback state change."""
         self.status_bar.showMessage(f"Playback: {state}")
     
-    def on_annotation_added(self, annotation: Dict[str, Any]):
+    @Slot(str)
+    def on_annotation_added(self, annotation_id: str):
         """Handle annotation added."""
         if self.current_media_item:
+            annotation = self.annotation_widget.get_annotation_data(annotation_id)
+            if annotation is None:
+                return
+            
             # Save annotation to database
             self.review_model.add_annotation(self.current_media_item, annotation)
             self.status_bar.showMessage("Annotation added")
     
+    @Slot(dict)
     def on_approval_changed(self, approval_data: Dict[str, Any]):
         """Handle approval status change."""
         if self.current_media_item:
@@ -434,6 +520,7 @@ class ReviewAppMainWindow(QMainWindow):
             self.review_model.update_approval_status(self.current_media_item, approval_data)
             self.status_bar.showMessage(f"Approval status: {approval_data.get('status', 'unknown')}")
     
+    @Slot()
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         if self.isFullScreen():
@@ -441,6 +528,7 @@ class ReviewAppMainWindow(QMainWindow):
         else:
             self.showFullScreen()
     
+    @Slot()
     def clear_annotations(self):
         """Clear all annotations for current media."""
         if self.current_media_item:
@@ -456,6 +544,7 @@ class ReviewAppMainWindow(QMainWindow):
                 self.annotation_widget.clear_annotations()
                 self.status_bar.showMessage("Annotations cleared")
     
+    @Slot()
     def show_about(self):
         """Show about dialog."""
         QMessageBox.about(
@@ -484,6 +573,17 @@ class ReviewAppMainWindow(QMainWindow):
         QMessageBox.critical(self, title, message)
         self.status_bar.showMessage(f"Error: {title}")
     
+    def showEvent(self, event):
+        """Resume auto-refresh when the window is shown."""
+        super().showEvent(event)
+        if self.current_project_id:
+            self.refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Pause auto-refresh while the window is hidden."""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+    
     def closeEvent(self, event):
         """Handle application close event."""
         reply = QMessageBox.question(
@@ -499,24 +599,29 @@ class ReviewAppMainWindow(QMainWindow):
         else:
             event.ignore()
 
-    def on_filters_changed(self, filters: Dict[str, Any]):
+    @Slot(object)
+    def on_filters_changed(self, criteria: FilterCriteria):
         """Handle filter changes."""
-        self.current_filters = filters
-        print(f"Filters changed: {filters}")
+        self.current_filters = criteria.to_dict()
+        self._media_request += 1  # Drop loads started with the previous filters
+        print(f"Filters changed: {self.current_filters}")
 
-        # Refresh media list with new filters
+        # Refresh media list with new filters once changes settle
         if self.current_project_id:
-            self.refresh_media_list()
+            self.filter_refresh_timer.start()
 
+    @Slot()
     def on_filters_cleared(self):
         """Handle filter clearing."""
         self.current_filters = {}
+        self._media_request += 1  # Drop loads started with the previous filters
         print("Filters cleared")
 
-        # Refresh media list without filters
+        # Refresh media list without filters once changes settle
         if self.current_project_id:
-            self.refresh_media_list()
+            self.filter_refresh_timer.start()
 
+    @Slot(str, bool)
     def on_panel_toggled(self, panel_name: str, expanded: bool):
         """Handle panel toggle events and adjust layout."""
         print(f"Panel '{panel_name}' {'expanded' if expanded else 'collapsed'}")
@@ -552,6 +657,7 @@ class ReviewAppMainWindow(QMainWindow):
 
         print(f"Layout adjusted: Left={left_width}, Center={center_width}, Right={right_width}")
 
+    @Slot()
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         if self.isFullScreen():
@@ -4,5 +4,6 @@ Review Application Utilities Module
 Utility functions and helpers specific to the Review Application.
 """
 
-# Utilities will be added here as needed
-__all__ = []
+from .media_prep import parse_task_id
+
+__all__ = ['parse_task_id']
@@ -0,0 +1,26 @@
+"""
+Media Preparation
+
+Shared preprocessing for media items displayed by the Review Application widgets.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=4096)
+def parse_task_id(task_id: str) -> Tuple[str, str, str]:
+    """
+    Parse a task_id into (episode, sequence, shot).
+
+    Task ids look like ep00_sq010_sh020_task. Parts that are missing are
+    returned as empty strings. Results are cached, so the filter and media
+    list widgets share the work without modifying the media items.
+    """
+    parts = task_id.split('_', 3) if task_id else ()
+    count = len(parts)
+
+    episode = parts[0] if count >= 3 else ''
+    sequence = parts[1] if count >= 2 else ''
+    shot = parts[2] if count >= 3 else ''
+    return episode, sequence, shot